@@ -0,0 +1,304 @@
+"""
+ASCII Art API - local HTTP service around ASCIIArtGenerator
+===========================================================
+
+Text and image rendering with a content-addressed result cache: the key
+is a hash of the input bytes and render options, it is sent as the ETag,
+and repeat requests are answered from memory (or with 304 Not Modified)
+without rendering again. Rendering runs in a process pool so large images
+never block the request threads.
+"""
+
+import argparse
+import threading
+import warnings
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError
+from io import BytesIO
+from typing import Callable, Dict, Optional
+
+from flask import Flask, Response, request, jsonify
+
+from ascii_batch import OUTPUT_FORMATS, init_worker, output_color, worker_generator
+from ascii_cache import RenderCache, cache_key, DEFAULT_MAX_BYTES
+from ascii_color import COLOR_MODES
+from ascii_export import EXPORT_FORMATS, export_rows
+from ascii_generator import (ASCIIArtGenerator, RENDER_MODES, RESAMPLE_FILTERS, TEXT_FONTS,
+                             open_image)
+
+
+app = Flask(__name__)
+
+# Limits for request parameters
+MAX_UPLOAD_BYTES = 32 * 1024 * 1024
+MAX_TEXT_LENGTH = 200
+MIN_WIDTH, MAX_WIDTH = 10, 1000
+# Seconds a request waits for its render
+RENDER_TIMEOUT = 60
+
+MIMETYPES = {
+    'txt': 'text/plain; charset=utf-8',
+    'ansi': 'text/plain; charset=utf-8',
+    'html': 'text/html; charset=utf-8',
+    'svg': 'image/svg+xml'
+}
+CHAR_SETS = tuple(ASCIIArtGenerator().char_sets)
+
+app.config['MAX_CONTENT_LENGTH'] = MAX_UPLOAD_BYTES
+
+cache = RenderCache()
+pool: Optional[ProcessPoolExecutor] = None
+# Renders in progress, so identical concurrent requests share one
+pending: Dict[str, Future] = {}
+pending_lock = threading.Lock()
+
+
+def export(rows, fmt: str, title: str) -> bytes:
+    if fmt in EXPORT_FORMATS:
+        rows = export_rows(rows, fmt, title)
+    return ("\n".join(rows) + "\n").encode('utf-8')
+
+
+def render_text_job(text: str, font: str, width: int, fmt: str) -> bytes:
+    """Worker: figlet text in the requested format"""
+    art = worker_generator().text_to_ascii(text, font, width)
+    if art.startswith('❌'):
+        raise ValueError(art)
+    return export(art.split("\n"), fmt, text)
+
+
+def render_image_job(data: bytes, options: dict, fmt: str) -> bytes:
+    """Worker: uploaded image bytes in the requested format"""
+    from PIL import Image, UnidentifiedImageError
+
+    try:
+        with warnings.catch_warnings():
+            # Pillow only warns between one and two times its pixel limit;
+            # uploads that large are refused rather than decoded
+            warnings.simplefilter('error', Image.DecompressionBombWarning)
+            img = open_image(BytesIO(data))
+    except UnidentifiedImageError:
+        raise ValueError("Unsupported or corrupt image")
+    except (Image.DecompressionBombWarning, Image.DecompressionBombError):
+        raise ValueError(f"Image has more than {Image.MAX_IMAGE_PIXELS:,} pixels")
+    with img:
+        return export(worker_generator().iter_rows(img, **options), fmt, 'ASCII Art')
+
+
+def get_pool() -> ProcessPoolExecutor:
+    global pool
+    if pool is None:
+        pool = ProcessPoolExecutor(initializer=init_worker)
+    return pool
+
+
+def render_cached(key: str, job: Callable, *args) -> bytes:
+    """Cached result for key, rendering it in the pool on a miss"""
+    result = cache.get(key)
+    if result is not None:
+        return result
+
+    with pending_lock:
+        future = pending.get(key)
+        owner = future is None
+        if owner:
+            future = pending[key] = get_pool().submit(job, *args)
+    try:
+        result = future.result(timeout=RENDER_TIMEOUT)
+    finally:
+        if owner:
+            with pending_lock:
+                pending.pop(key, None)
+    if owner:
+        cache.put(key, result)
+    return result
+
+
+def parse_int(data, key, default, low, high):
+    """Read an integer option and check its range"""
+    try:
+        value = int(data.get(key, default))
+    except (TypeError, ValueError):
+        raise ValueError(f"'{key}' must be an integer")
+    if not low <= value <= high:
+        raise ValueError(f"'{key}' must be between {low} and {high}")
+    return value
+
+
+def parse_bool(data, key, default):
+    """Read a boolean option from JSON or a query string"""
+    value = data.get(key, default)
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes', 'on')
+    return bool(value)
+
+
+def parse_choice(data, key, default, choices):
+    value = data.get(key, default)
+    if value not in choices:
+        raise ValueError(f"'{key}' must be one of: {', '.join(choices)}")
+    return value
+
+
+def parse_format(data) -> str:
+    return parse_choice(data, 'format', 'txt', OUTPUT_FORMATS)
+
+
+def image_options(data, fmt: str) -> dict:
+    """Keyword arguments for iter_rows from request options"""
+    color = data.get('color') or None
+    if color is not None and color not in COLOR_MODES:
+        raise ValueError(f"'color' must be one of: {', '.join(COLOR_MODES)}")
+    return {
+        'width': parse_int(data, 'width', 80, MIN_WIDTH, MAX_WIDTH),
+        'char_set': parse_choice(data, 'chars', 'detailed', CHAR_SETS),
+        'resample': parse_choice(data, 'resample', 'bicubic', list(RESAMPLE_FILTERS)),
+        'color': output_color(fmt, color),
+        'render_mode': parse_choice(data, 'mode', 'brightness', RENDER_MODES),
+        'dither': parse_bool(data, 'dither', False)
+    }
+
+
+def request_options():
+    """Options from a JSON body, or from the query string (and form fields)"""
+    if request.is_json:
+        return request.get_json(silent=True) or {}
+    options = request.args.to_dict()
+    options.update(request.form.to_dict())
+    return options
+
+
+def art_response(key: str, fmt: str, render: Callable[[], bytes]) -> Response:
+    """Rendered art with the cache key as its ETag, or 304 if the client has it"""
+    if request.if_none_match.contains(key):
+        response = Response(status=304)
+    else:
+        response = Response(render(), mimetype=MIMETYPES[fmt])
+    response.set_etag(key)
+    # Clients revalidate with If-None-Match instead of re-downloading
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def error_response(error: Exception, status: int = 400):
+    return jsonify({'success': False, 'error': str(error)}), status
+
+
+@app.route('/api/text', methods=['GET', 'POST'])
+def text_art():
+    """Render text with a figlet font"""
+    try:
+        data = request_options()
+        text = data.get('text')
+        if not isinstance(text, str) or not text:
+            raise ValueError("'text' is required")
+        if len(text) > MAX_TEXT_LENGTH:
+            raise ValueError(f"'text' must be at most {MAX_TEXT_LENGTH} characters")
+        font = parse_choice(data, 'font', 'slant', TEXT_FONTS)
+        width = parse_int(data, 'width', 80, MIN_WIDTH, MAX_WIDTH)
+        fmt = parse_format(data)
+    except ValueError as e:
+        return error_response(e)
+
+    key = cache_key(text.encode('utf-8'), {'kind': 'text', 'font': font,
+                                           'width': width, 'format': fmt})
+    try:
+        return art_response(key, fmt, lambda: render_cached(key, render_text_job,
+                                                            text, font, width, fmt))
+    except ValueError as e:
+        return error_response(e)
+    except TimeoutError:
+        return error_response(TimeoutError("Rendering timed out"), 503)
+
+
+@app.route('/api/image', methods=['POST'])
+def image_art():
+    """Render an uploaded image (multipart field 'image', or the raw body);
+    options come from the query string or form fields"""
+    try:
+        data = request_options()
+        upload = request.files.get('image')
+        image_bytes = upload.read() if upload else request.get_data()
+        if not image_bytes:
+            raise ValueError("An image is required (multipart field 'image' or request body)")
+        fmt = parse_format(data)
+        options = image_options(data, fmt)
+    except ValueError as e:
+        return error_response(e)
+
+    key = cache_key(image_bytes, dict(options, kind='image', format=fmt))
+    try:
+        return art_response(key, fmt, lambda: render_cached(key, render_image_job,
+                                                            image_bytes, options, fmt))
+    except TimeoutError:
+        return error_response(TimeoutError("Rendering timed out"), 503)
+    except Exception as e:
+        # Undecodable uploads surface from the worker as PIL errors
+        return error_response(ValueError(f"Could not render image: {e}"))
+
+
+@app.route('/api/options')
+def render_options():
+    """Accepted values for the render options"""
+    return jsonify({
+        'fonts': list(TEXT_FONTS),
+        'chars': list(CHAR_SETS),
+        'resample': list(RESAMPLE_FILTERS),
+        'color': list(COLOR_MODES),
+        'mode': list(RENDER_MODES),
+        'format': list(OUTPUT_FORMATS),
+        'width': [MIN_WIDTH, MAX_WIDTH]
+    })
+
+
+@app.route('/health')
+def health():
+    """Health check endpoint"""
+    return jsonify({
+        'status': 'healthy',
+        'service': 'ascii-generator',
+        'cache': cache.stats()
+    })
+
+
+@app.errorhandler(404)
+def not_found(error):
+    return jsonify({'error': 'Endpoint not found'}), 404
+
+
+@app.errorhandler(405)
+def method_not_allowed(error):
+    return jsonify({'error': 'Method not allowed'}), 405
+
+
+@app.errorhandler(413)
+def too_large(error):
+    return jsonify({'error': f'Upload larger than {MAX_UPLOAD_BYTES // (1024 * 1024)} MB'}), 413
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='ASCII Art API server')
+    parser.add_argument('--port', type=int, default=5051, help='Port (default: 5051)')
+    parser.add_argument('--workers', type=int, help='Render processes (default: CPU count)')
+    parser.add_argument('--cache-mb', type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        help='In-memory cache size in MB (default: 64)')
+    parser.add_argument('--cache-dir', help='Directory for a persistent cache tier')
+    args = parser.parse_args()
+
+    cache = RenderCache(args.cache_mb * 1024 * 1024, args.cache_dir)
+    pool = ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker)
+
+    print("🎨 Starting ASCII Art API...")
+    print(f"📡 Server: http://127.0.0.1:{args.port}")
+    print("📚 API Endpoints:")
+    print("   GET/POST /api/text    - Text banner (text, font, width, format)")
+    print("   POST     /api/image   - Image upload (width, chars, resample, color, mode, dither, format)")
+    print("   GET      /api/options - Accepted option values")
+    print("   GET      /health      - Health check and cache statistics")
+    print(f"🗄️  Cache: {args.cache_mb} MB in memory" +
+          (f", persisted to {args.cache_dir}" if args.cache_dir else ""))
+    print("⏹️  Press Ctrl+C to stop")
+
+    try:
+        app.run(host='127.0.0.1', port=args.port, threaded=True, use_reloader=False)
+    finally:
+        pool.shutdown(cancel_futures=True)
@@ -0,0 +1,174 @@
+"""
+ASCII animation playback for animated GIF/APNG/WebP files and
+directories of numbered frames.
+Frames are rendered through ASCIIArtGenerator in a background thread
+while the terminal player paces output against frame deadlines and
+drops frames when it falls behind.
+"""
+
+import os
+import re
+import sys
+import time
+import queue
+import threading
+from typing import Iterator, List, Optional, Tuple
+
+from PIL import Image, ImageSequence
+
+from ascii_generator import ASCIIArtGenerator, IMAGE_EXTENSIONS
+from ascii_terminal import DeltaRenderer
+
+
+# Frame duration used when neither --fps nor the file provides one
+DEFAULT_FRAME_MS = 100
+# Frames rendered ahead of playback
+PRERENDER_FRAMES = 32
+
+HIDE_CURSOR = "\x1b[?25l"
+SHOW_CURSOR = "\x1b[?25h"
+
+
+def natural_key(name: str):
+    """Sort key that orders frame2 before frame10"""
+    return [int(part) if part.isdigit() else part.lower() for part in re.split(r'(\d+)', name)]
+
+
+def iter_frames(source: str) -> Iterator[Tuple[Image.Image, int]]:
+    """Yield (frame, duration_ms) from an animated image or a frame directory"""
+    if os.path.isdir(source):
+        names = sorted((n for n in os.listdir(source)
+                        if os.path.splitext(n)[1].lower() in IMAGE_EXTENSIONS),
+                       key=natural_key)
+        if not names:
+            raise ValueError(f"No image frames found in {source}")
+        for name in names:
+            with Image.open(os.path.join(source, name)) as img:
+                yield img, DEFAULT_FRAME_MS
+        return
+
+    with Image.open(source) as img:
+        for frame in ImageSequence.Iterator(img):
+            yield frame, frame.info.get('duration') or DEFAULT_FRAME_MS
+
+
+class ASCIIAnimationPlayer:
+
+    def __init__(self, generator: ASCIIArtGenerator, width: int = 80,
+                 char_set: str = 'detailed', resample: str = 'bicubic',
+                 fps: Optional[float] = None, loops: int = 1, out=None,
+                 render_mode: str = 'brightness', dither: bool = False):
+        self.generator = generator
+        self.width = width
+        self.char_set = char_set
+        self.resample = resample
+        self.render_mode = render_mode
+        self.dither = dither
+        # A fixed fps overrides per-frame durations from the file
+        self.fps = fps
+        # 0 loops forever
+        self.loops = loops
+        self.out = out or sys.stdout
+        # Only changed character runs are written each frame
+        self.renderer = DeltaRenderer(self.out)
+
+        self.stats = {'shown': 0, 'dropped': 0, 'stalls': 0, 'elapsed': 0.0,
+                      'bytes_written': 0, 'full_redraw_bytes': 0}
+
+    def _frame_seconds(self, duration_ms: int) -> float:
+        if self.fps:
+            return 1.0 / self.fps
+        return duration_ms / 1000.0
+
+    def _prerender(self, source: str, frames: queue.Queue, cache: List, stop: threading.Event):
+        """Render every frame once (background thread)"""
+        try:
+            for img, duration in iter_frames(source):
+                if stop.is_set():
+                    return
+                text = self.generator.render_image(img, self.width, self.char_set, self.resample,
+                                                   render_mode=self.render_mode, dither=self.dither)
+                item = (text, self._frame_seconds(duration))
+                cache.append(item)
+                frames.put(item)
+            frames.put(None)
+        except Exception as e:
+            frames.put(e)
+
+    def _timeline(self, source: str, stop: threading.Event) -> Iterator[Tuple[str, float, bool]]:
+        """First pass straight from the renderer, later loops from the cache"""
+        frames = queue.Queue(maxsize=PRERENDER_FRAMES)
+        cache = []
+        worker = threading.Thread(target=self._prerender, args=(source, frames, cache, stop),
+                                  daemon=True)
+        worker.start()
+
+        while True:
+            stalled = False
+            try:
+                item = frames.get_nowait()
+            except queue.Empty:
+                # Renderer has not caught up: playback has to wait
+                stalled = True
+                item = frames.get()
+            if item is None:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item + (stalled,)
+
+        loop = 1
+        while self.loops == 0 or loop < self.loops:
+            for text, seconds in cache:
+                yield text, seconds, False
+            loop += 1
+
+    def play(self, source: str) -> dict:
+        """Play an animation, returning playback statistics"""
+        stop = threading.Event()
+        self.out.write(HIDE_CURSOR)
+        self.renderer.reset()
+        start = time.perf_counter()
+        deadline = start
+
+        try:
+            for text, seconds, stalled in self._timeline(source, stop):
+                now = time.perf_counter()
+                if stalled:
+                    # Waiting on the renderer is not lateness: restart the clock
+                    if self.stats['shown'] or self.stats['dropped']:
+                        self.stats['stalls'] += 1
+                    deadline = max(deadline, now)
+                deadline += seconds
+                if now > deadline:
+                    # Already past this frame's slot: skip it to stay on schedule
+                    self.stats['dropped'] += 1
+                    continue
+
+                self.renderer.draw(text)
+                self.stats['shown'] += 1
+
+                remaining = deadline - time.perf_counter()
+                if remaining > 0:
+                    time.sleep(remaining)
+        finally:
+            stop.set()
+            self.renderer.finish()
+            self.out.write(SHOW_CURSOR)
+            self.out.flush()
+
+        self.stats['elapsed'] = time.perf_counter() - start
+        self.stats['bytes_written'] = self.renderer.bytes_written
+        self.stats['full_redraw_bytes'] = self.renderer.full_bytes
+        return self.stats
+
+
+def format_stats(stats: dict) -> str:
+    """One-line playback summary"""
+    fps = stats['shown'] / stats['elapsed'] if stats['elapsed'] else 0.0
+    summary = (f"🎞️ {stats['shown']} frames shown, {stats['dropped']} dropped, "
+               f"{stats['stalls']} render stalls, {fps:.1f} fps over {stats['elapsed']:.1f}s")
+    if stats['bytes_written']:
+        ratio = stats['full_redraw_bytes'] / stats['bytes_written']
+        summary += f"\n📉 {stats['bytes_written']:,} bytes written ({ratio:.1f}x less than full redraws)"
+    return summary
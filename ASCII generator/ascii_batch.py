@@ -0,0 +1,178 @@
+"""
+Parallel conversion of an image directory tree to ASCII art.
+Every image under the source directory is rendered in a process pool and
+written to the same relative path under the output directory (with the
+format appended as an extension). Outputs newer than their source image
+and rendered with the same options (recorded in a manifest in the output
+directory) are skipped, so re-running only converts what changed.
+"""
+
+import os
+import json
+import time
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ascii_export import EXPORT_FORMATS, export_rows
+from ascii_generator import ASCIIArtGenerator, IMAGE_EXTENSIONS, open_image
+
+
+OUTPUT_FORMATS = ('txt', 'ansi') + EXPORT_FORMATS
+# Color used for 'ansi' output when none is given
+DEFAULT_ANSI_COLOR = '256'
+# Output path -> fingerprint of the options it was rendered with
+MANIFEST_NAME = ".ascii_batch.json"
+
+# One generator per worker process, created by the pool initializer
+_generator: Optional[ASCIIArtGenerator] = None
+
+
+def find_images(root: str) -> Iterator[str]:
+    """Image files under root, in a stable order"""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS:
+                yield os.path.join(dirpath, name)
+
+
+def output_path(source: str, root: str, output_dir: str, fmt: str) -> str:
+    """Mirrored output path; photo.jpg becomes photo.jpg.txt so photo.png cannot collide"""
+    relative = os.path.relpath(source, root)
+    return os.path.join(output_dir, f"{relative}.{fmt}")
+
+
+def is_up_to_date(source: str, target: str) -> bool:
+    try:
+        return os.path.getmtime(target) >= os.path.getmtime(source)
+    except OSError:
+        return False
+
+
+def options_fingerprint(fmt: str, options: Dict) -> str:
+    key = json.dumps([fmt, options], sort_keys=True)
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+
+def load_manifest(output_dir: str) -> Dict[str, str]:
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        return manifest if isinstance(manifest, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(output_dir: str, manifest: Dict[str, str]):
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    # Write to a temp file first so an interrupted run keeps the old manifest
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=0, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def init_worker():
+    """Pool initializer: one generator per worker process"""
+    global _generator
+    _generator = ASCIIArtGenerator()
+
+
+def worker_generator() -> ASCIIArtGenerator:
+    """This worker's generator, or a new one outside a pool"""
+    return _generator or ASCIIArtGenerator()
+
+
+def output_color(fmt: str, color: Optional[str]) -> Optional[str]:
+    """Color mode an output format is rendered with: 'ansi' always has
+    one and 'txt' never does"""
+    if fmt == 'ansi':
+        return color or DEFAULT_ANSI_COLOR
+    if fmt == 'txt':
+        return None
+    return color
+
+
+def convert_file(job: Tuple[str, str, str, Dict]) -> Tuple[str, Optional[str]]:
+    """Render one image and write it; returns (source, error or None)"""
+    source, target, fmt, options = job
+    generator = worker_generator()
+    try:
+        with open_image(source) as img:
+            rows = generator.iter_rows(img, **options)
+            if fmt in EXPORT_FORMATS:
+                rows = export_rows(rows, fmt, os.path.basename(source))
+            content = "\n".join(rows) + "\n"
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return source, None
+    except Exception as e:
+        return source, str(e)
+
+
+def convert_tree(source_dir: str, output_dir: str, fmt: str = 'txt', width: int = 80,
+                 char_set: str = 'detailed', resample: str = 'bicubic',
+                 color: Optional[str] = None, workers: Optional[int] = None,
+                 force: bool = False, render_mode: str = 'brightness',
+                 dither: bool = False) -> dict:
+    """Convert every image under source_dir, returning conversion statistics"""
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format '{fmt}'")
+
+    # Keyword arguments for iter_rows
+    options = {'width': width, 'char_set': char_set, 'resample': resample,
+               'render_mode': render_mode, 'dither': dither,
+               'color': output_color(fmt, color)}
+
+    fingerprint = options_fingerprint(fmt, options)
+    manifest = load_manifest(output_dir)
+
+    start = time.perf_counter()
+    jobs = []
+    skipped = 0
+    for source in find_images(source_dir):
+        target = output_path(source, source_dir, output_dir, fmt)
+        key = os.path.relpath(target, output_dir)
+        # Same options and newer than the source: nothing to do
+        if not force and manifest.get(key) == fingerprint and is_up_to_date(source, target):
+            skipped += 1
+            continue
+        manifest.pop(key, None)
+        jobs.append((source, target, fmt, options))
+
+    failures: List[Tuple[str, str]] = []
+    if jobs:
+        workers = min(workers or os.cpu_count() or 1, len(jobs))
+        # Several images per task keeps inter-process overhead small
+        chunksize = max(1, min(16, len(jobs) // (workers * 4)))
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+            results = pool.map(convert_file, jobs, chunksize=chunksize)
+            for (source, target, _, _), (_, error) in zip(jobs, results):
+                if error:
+                    failures.append((source, error))
+                else:
+                    manifest[os.path.relpath(target, output_dir)] = fingerprint
+        save_manifest(output_dir, manifest)
+
+    elapsed = time.perf_counter() - start
+    converted = len(jobs) - len(failures)
+    return {
+        'converted': converted,
+        'skipped': skipped,
+        'failed': failures,
+        'elapsed': elapsed,
+        'images_per_sec': converted / elapsed if elapsed else 0.0
+    }
+
+
+def format_stats(stats: dict) -> str:
+    """Summary of a directory conversion"""
+    summary = (f"✅ {stats['converted']} converted, {stats['skipped']} up to date, "
+               f"{len(stats['failed'])} failed in {stats['elapsed']:.2f}s "
+               f"({stats['images_per_sec']:.1f} images/sec)")
+    for source, error in stats['failed']:
+        summary += f"\n❌ {source}: {error}"
+    return summary
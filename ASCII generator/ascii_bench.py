@@ -0,0 +1,356 @@
+"""
+Benchmark suite for the ASCII generator.
+Measures CLI startup time for the info commands and the text command in
+fresh interpreters, image conversion of synthetic images of several sizes
+for every character set and output width (time per stage: decode, resize,
+map, join, plus peak memory), rendering with every text font, and a check
+that banded decoding of huge uncompressed sources (TIFF, BMP, PPM) gives
+the same art as the normal path. Results are printed (or saved) as JSON;
+the exit code is 1 if --list-fonts exceeds its startup budget or the
+banded output differs.
+example usage: python ascii_bench.py --runs 20 -o bench.json
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+SCRIPT = os.path.join(script_dir, "ascii_generator.py")
+
+DEFAULT_RUNS = 15
+# Median wall time allowed for --list-fonts
+DEFAULT_BUDGET_MS = 50.0
+SUITES = ('startup', 'image', 'text', 'tiles')
+
+# Synthetic image sizes, file formats and output widths for the image suite
+IMAGE_SIZES = [(640, 480), (1920, 1080), (4000, 3000)]
+IMAGE_FORMATS = ['jpg', 'png']
+WIDTHS = [80, 200, 500, 1000]
+# Repetitions per image and text case (median reported)
+DEFAULT_CASE_RUNS = 3
+SAMPLE_TEXT = "Hello ASCII"
+
+# Uncompressed formats read in bands, the source size for the tiles suite,
+# and the band budget that splits it into several strips
+TILE_FORMATS = ['tif', 'bmp', 'ppm']
+TILE_SIZE = (3000, 2000)
+TILE_BAND_PIXELS = 1_000_000
+# Mean distance along the character ramp (0-1) allowed between banded and
+# normal output; both area-average, so only rounding at cell edges differs
+TILE_TOLERANCE = 0.02
+
+STARTUP_CASES = [
+    ('baseline', ['-c', 'pass']),
+    ('list_fonts', [SCRIPT, '--list-fonts']),
+    ('list_chars', [SCRIPT, '--list-chars']),
+    ('help_detailed', [SCRIPT, '--help-detailed']),
+    ('text', [SCRIPT, 'text', 'Hi']),
+    ('preview_fonts', [SCRIPT, '--preview-fonts', 'ABC']),
+]
+
+
+def time_command(argv, runs):
+    """Wall times in ms of running the interpreter with argv"""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + argv, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def run_startup(runs):
+    results = []
+    for name, argv in STARTUP_CASES:
+        time_command(argv, 1)  # warm the OS file cache and __pycache__
+        times = time_command(argv, runs)
+        result = {
+            'case': name,
+            'median_ms': round(statistics.median(times), 2),
+            'min_ms': round(min(times), 2),
+            'max_ms': round(max(times), 2),
+            'runs': runs
+        }
+        results.append(result)
+        print(f"⏱️ {name:<14} {result['median_ms']:>8.1f} ms (median)", file=sys.stderr)
+    return results
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process, or None where it cannot be read"""
+    # VmHWM starts afresh at exec; ru_maxrss can carry over the parent's peak
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    try:
+        # Unix only
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def median_ms(times):
+    return round(statistics.median(times) * 1000, 3)
+
+
+def synthetic_image(size):
+    """RGB test image with smooth gradients, hard edges and noise"""
+    from PIL import Image, ImageDraw
+
+    width, height = size
+    linear = Image.linear_gradient('L').resize(size)
+    radial = Image.radial_gradient('L').resize(size)
+    noise = Image.effect_noise(size, 48)
+    img = Image.merge('RGB', (linear, radial, noise))
+    draw = ImageDraw.Draw(img)
+    for i in range(8):
+        x, y = width * i // 8, height * i // 8
+        draw.rectangle((x, y, x + width // 10, y + height // 10), fill=(255 - 32 * i,) * 3)
+        draw.line((0, y, width, height - y), fill=(32 * i, 0, 255 - 32 * i), width=max(1, width // 200))
+    return img
+
+
+def image_case(path, width, runs):
+    """Stage times for every character set converting one image at one width;
+    run in its own process so peak memory belongs to this case alone"""
+    from ascii_generator import ASCIIArtGenerator, REDUCE_GAP, map_pixels, open_image
+
+    generator = ASCIIArtGenerator()
+    # Warm-up: loads the image plugins and fills the lookup caches
+    with open_image(path) as img:
+        generator.render_image(img, width)
+    baseline_rss = peak_rss_mb()
+    results = []
+    for char_set, chars in generator.char_sets.items():
+        stages = {'decode': [], 'resize': [], 'map': [], 'join': [], 'total': []}
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            with open_image(path) as img:
+                # Same reduced-scale decode prepare_image asks for
+                height = int(width * img.height / img.width * 0.5)
+                img.draft('L', (width * REDUCE_GAP, height * REDUCE_GAP))
+                img.load()
+                t1 = time.perf_counter()
+                small = generator.prepare_image(img, width)
+            t2 = time.perf_counter()
+            text = map_pixels(small.tobytes(), chars)
+            t3 = time.perf_counter()
+            art = "\n".join(text[i:i + width] for i in range(0, len(text), width))
+            t4 = time.perf_counter()
+            for stage, seconds in zip(stages, (t1 - t0, t2 - t1, t3 - t2, t4 - t3, t4 - t0)):
+                stages[stage].append(seconds)
+        results.append({
+            'char_set': char_set,
+            'rows': art.count("\n") + 1,
+            **{f"{stage}_ms": median_ms(times) for stage, times in stages.items()}
+        })
+    return {'baseline_rss_mb': baseline_rss, 'peak_rss_mb': peak_rss_mb(), 'char_sets': results}
+
+
+def run_images(sizes, formats, widths, runs):
+    with tempfile.TemporaryDirectory() as tmp:
+        results = []
+        for size in sizes:
+            img = synthetic_image(size)
+            for fmt in formats:
+                path = os.path.join(tmp, f"synthetic_{size[0]}x{size[1]}.{fmt}")
+                if fmt == 'jpg':
+                    img.save(path, quality=90)
+                else:
+                    img.save(path)
+                for width in widths:
+                    spec = json.dumps({'path': path, 'width': width, 'runs': runs})
+                    proc = subprocess.run([sys.executable, os.path.abspath(__file__),
+                                           '--image-case', spec],
+                                          capture_output=True, text=True, check=True)
+                    case = json.loads(proc.stdout)
+                    case.update({'size': f"{size[0]}x{size[1]}", 'format': fmt, 'width': width,
+                                 'file_kb': round(os.path.getsize(path) / 1024, 1)})
+                    results.append(case)
+                    slowest = max(r['total_ms'] for r in case['char_sets'])
+                    peak = case['peak_rss_mb']
+                    peak = f"{peak:>6.1f} MB" if peak is not None else "   n/a"
+                    print(f"⏱️ {case['size']:>9} {fmt:<4} width {width:<5} "
+                          f"{slowest:>8.1f} ms  {peak} peak", file=sys.stderr)
+    return results
+
+
+def run_text(widths, runs):
+    """Time to load the font bundle, then per-font renderer setup and render time"""
+    from ascii_fonts import bundled_fonts
+    from ascii_generator import TEXT_FONTS, figlet_renderer
+
+    start = time.perf_counter()
+    bundled_fonts(TEXT_FONTS)
+    report = {'bundle_load_ms': round((time.perf_counter() - start) * 1000, 3), 'fonts': []}
+
+    for font in TEXT_FONTS:
+        for width in widths:
+            start = time.perf_counter()
+            renderer = figlet_renderer(font, width)
+            setup = time.perf_counter() - start
+            times = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                art = renderer.renderText(SAMPLE_TEXT)
+                times.append(time.perf_counter() - start)
+            report['fonts'].append({
+                'font': font,
+                'width': width,
+                'setup_ms': round(setup * 1000, 3),
+                'render_ms': median_ms(times),
+                'lines': art.count("\n")
+            })
+        print(f"⏱️ {font:<14} {report['fonts'][-1]['render_ms']:>8.2f} ms", file=sys.stderr)
+    return report
+
+
+def run_tiles(widths):
+    """Compare banded decoding against the normal path for each format"""
+    import ascii_generator
+    import ascii_tiles
+    from ascii_generator import ASCIIArtGenerator, open_image
+
+    generator = ASCIIArtGenerator()
+    chars = generator.char_sets['detailed']
+    saved = ascii_generator.TILED_MIN_PIXELS, ascii_tiles.MAX_BAND_PIXELS
+    results = []
+    try:
+        ascii_tiles.MAX_BAND_PIXELS = TILE_BAND_PIXELS
+        with tempfile.TemporaryDirectory() as tmp:
+            img = synthetic_image(TILE_SIZE)
+            for fmt in TILE_FORMATS:
+                path = os.path.join(tmp, f"synthetic.{fmt}")
+                img.save(path)
+                for width in widths:
+                    renders = []
+                    # Every source is "huge", then none is
+                    for limit in (0, float('inf')):
+                        ascii_generator.TILED_MIN_PIXELS = limit
+                        with open_image(path) as source:
+                            renders.append("".join(generator.iter_rows(source, width,
+                                                                       resample='box')))
+                    banded, normal = renders
+                    distance = sum(abs(chars.index(a) - chars.index(b))
+                                   for a, b in zip(banded, normal)) / (len(chars) - 1)
+                    distance = round(distance / max(1, len(normal)), 4)
+                    passed = len(banded) == len(normal) and distance <= TILE_TOLERANCE
+                    results.append({'format': fmt, 'width': width,
+                                    'distance': distance, 'passed': passed})
+                    print(f"{'✅' if passed else '❌'} {fmt:<4} width {width:<5} "
+                          f"distance {distance:.4f}", file=sys.stderr)
+    finally:
+        ascii_generator.TILED_MIN_PIXELS, ascii_tiles.MAX_BAND_PIXELS = saved
+    return results
+
+
+def parse_sizes(value):
+    try:
+        return [tuple(int(n) for n in size.lower().split('x')) for size in value.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError("sizes look like 640x480,1920x1080")
+
+
+def parse_ints(value):
+    try:
+        return [int(n) for n in value.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected comma-separated integers")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the ASCII generator")
+    parser.add_argument("--suite", default=",".join(SUITES),
+                        help=f"Comma-separated suites to run (default: {','.join(SUITES)})")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS,
+                        help=f"Runs per startup case (default: {DEFAULT_RUNS})")
+    parser.add_argument("--case-runs", type=int, default=DEFAULT_CASE_RUNS,
+                        help=f"Runs per image and text case (default: {DEFAULT_CASE_RUNS})")
+    parser.add_argument("--sizes", type=parse_sizes, default=IMAGE_SIZES,
+                        help="Synthetic image sizes (default: 640x480,1920x1080,4000x3000)")
+    parser.add_argument("--formats", default=",".join(IMAGE_FORMATS),
+                        help=f"Image file formats (default: {','.join(IMAGE_FORMATS)})")
+    parser.add_argument("--widths", type=parse_ints, default=WIDTHS,
+                        help=f"Output widths (default: {','.join(map(str, WIDTHS))})")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"Fail if --list-fonts takes longer (default: {DEFAULT_BUDGET_MS})")
+    parser.add_argument("-o", "--output", help="Write JSON results to a file")
+    # Internal: one image case in a fresh process
+    parser.add_argument("--image-case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.image_case:
+        spec = json.loads(args.image_case)
+        print(json.dumps(image_case(spec['path'], spec['width'], spec['runs'])))
+        return
+
+    suites = [s.strip() for s in args.suite.split(',') if s.strip()]
+    unknown = set(suites) - set(SUITES)
+    if unknown:
+        parser.error(f"unknown suite(s): {', '.join(sorted(unknown))}")
+
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform()
+    }
+    if 'image' in suites:
+        report['image'] = run_images(args.sizes, args.formats.split(','), args.widths, args.case_runs)
+    if 'text' in suites:
+        report['text'] = run_text(args.widths, args.case_runs)
+    if 'tiles' in suites:
+        report['tiles'] = run_tiles(args.widths)
+    if 'startup' in suites:
+        report['startup'] = run_startup(args.runs)
+        report['startup_budget_ms'] = args.budget_ms
+        cases = {r['case']: r for r in report['startup']}
+        list_fonts = cases['list_fonts']
+        # Time spent in our code rather than in starting the interpreter
+        report['list_fonts_overhead_ms'] = round(list_fonts['median_ms'] - cases['baseline']['median_ms'], 2)
+        report['passed'] = list_fonts['median_ms'] <= args.budget_ms
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+        print(f"💾 Results saved to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+    failed = False
+    if 'tiles' in suites:
+        mismatches = [r for r in report['tiles'] if not r['passed']]
+        if mismatches:
+            print(f"❌ Banded output differs from the normal path in {len(mismatches)} case(s)",
+                  file=sys.stderr)
+            failed = True
+        else:
+            print("✅ Banded output matches the normal path", file=sys.stderr)
+    if 'startup' in suites:
+        if not report['passed']:
+            print(f"❌ --list-fonts took {list_fonts['median_ms']:.1f} ms "
+                  f"(budget {args.budget_ms:.0f} ms)", file=sys.stderr)
+            failed = True
+        else:
+            print("✅ Startup within budget", file=sys.stderr)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Braille sub-pixel rendering.
+Each output character is a Unicode Braille pattern covering a 2x4 block
+of pixels, so the same number of columns carries eight times the pixels
+of the brightness ramp. Dot masks for the whole image are computed with
+numpy in one pass and turned into glyphs through a 256-entry table.
+"""
+
+from functools import lru_cache
+
+from ascii_generator import require_numpy
+
+
+BRAILLE_BASE = 0x2800
+# Pixels per character cell (columns, rows)
+BRAILLE_CELL = (2, 4)
+# Bit of each dot in the pattern, indexed [row][column]
+DOT_BITS = ((0x01, 0x08),
+            (0x02, 0x10),
+            (0x04, 0x20),
+            (0x40, 0x80))
+
+
+@lru_cache(maxsize=1)
+def braille_table() -> dict:
+    """str.translate table: dot mask byte -> Braille glyph"""
+    return {mask: chr(BRAILLE_BASE + mask) for mask in range(256)}
+
+
+def braille_masks(pixels, threshold=None):
+    """8-bit dot masks for a grayscale array whose sides are multiples of 2x4;
+    dark pixels (below threshold, default the image mean) become dots"""
+    np = require_numpy()
+    height, width = pixels.shape
+    if threshold is None:
+        threshold = pixels.mean()
+
+    # (rows, 4, columns, 2) view: one 2x4 block per character cell
+    dots = (pixels < threshold).reshape(height // 4, 4, width // 2, 2)
+    weights = np.array(DOT_BITS, dtype=np.uint8).reshape(1, 4, 1, 2)
+    return (dots * weights).sum(axis=(1, 3), dtype=np.uint8)
+
+
+def braille_glyphs(masks) -> str:
+    """Braille glyphs for an array of dot masks, row after row"""
+    # latin-1 maps each byte to the code point of the same value
+    return masks.tobytes().decode('latin-1').translate(braille_table())
@@ -0,0 +1,122 @@
+"""
+Content-addressed cache for rendered ASCII art.
+Results are keyed by a hash of the input bytes and the render options, so
+the same upload under any file name hits the same entry and the key can
+double as an HTTP ETag. Entries live in a size-limited in-memory LRU,
+optionally backed by a directory that survives restarts.
+"""
+
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+
+# Bump when rendering changes so stale entries are never served
+CACHE_VERSION = 1
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def cache_key(data: bytes, options: dict) -> str:
+    """Hash of the input bytes and the options that affect the output"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([CACHE_VERSION, options], sort_keys=True).encode('utf-8'))
+    digest.update(b"\0")
+    digest.update(data)
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """Thread-safe LRU of rendered results, bounded by total size in bytes"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, directory: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.entries: OrderedDict = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        # Two-level fan-out keeps directories small
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self.lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return value
+
+        value = self._read_disk(key)
+        with self.lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+        self._remember(key, value)
+        return value
+
+    def put(self, key: str, value: bytes):
+        self._remember(key, value)
+        self._write_disk(key, value)
+
+    def _remember(self, key: str, value: bytes):
+        # Results bigger than the whole budget only go to disk
+        if len(value) > self.max_bytes:
+            return
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self.entries[key] = value
+            self.size += len(value)
+            while self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(key), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_disk(self, key: str, value: bytes):
+        if not self.directory:
+            return
+        path = self._path(key)
+        temp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(temp, 'wb') as f:
+                f.write(value)
+            # Atomic rename: readers never see a partial entry
+            os.replace(temp, path)
+        except OSError:
+            # A full or read-only disk only costs the persistent tier
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                'entries': len(self.entries),
+                'bytes': self.size,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'directory': self.directory
+            }
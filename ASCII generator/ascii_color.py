@@ -0,0 +1,120 @@
+"""
+ANSI color output for ASCII art.
+Cell colors are quantized in C through Pillow (nearest xterm-256 entry
+via a palette image, or a per-channel lookup for truecolor), and an
+escape sequence is emitted only where the color changes along a row.
+"""
+
+from array import array
+from functools import lru_cache
+from itertools import groupby
+from typing import Iterator, List, Sequence, Tuple
+
+
+COLOR_MODES = ('256', 'truecolor')
+RESET = "\x1b[0m"
+# Truecolor channels are rounded to this many bits so neighbouring cells
+# share colors more often (keeps output compact without visible banding)
+TRUECOLOR_BITS = 5
+
+
+# xterm colors 0-15 (terminals may theme these)
+SYSTEM_COLORS = ((0, 0, 0), (128, 0, 0), (0, 128, 0), (128, 128, 0),
+                 (0, 0, 128), (128, 0, 128), (0, 128, 128), (192, 192, 192),
+                 (128, 128, 128), (255, 0, 0), (0, 255, 0), (255, 255, 0),
+                 (0, 0, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255))
+
+
+@lru_cache(maxsize=1)
+def xterm_palette() -> Tuple[Tuple[int, int, int], ...]:
+    """RGB values of xterm colors 16-255 (6x6x6 cube, then 24 grays)"""
+    levels = [0, 95, 135, 175, 215, 255]
+    colors = [(r, g, b) for r in levels for g in levels for b in levels]
+    colors += [(8 + 10 * i,) * 3 for i in range(24)]
+    return tuple(colors)
+
+
+def xterm_rgb(code: int) -> Tuple[int, int, int]:
+    """RGB value of an xterm 256-color code"""
+    if code < 16:
+        return SYSTEM_COLORS[code]
+    return xterm_palette()[code - 16]
+
+
+@lru_cache(maxsize=1)
+def palette_image():
+    """Palette image used by Image.quantize for nearest-color lookup"""
+    # PIL is imported here so importing COLOR_MODES stays cheap
+    from PIL import Image
+
+    colors = list(xterm_palette())
+    # Pad to 256 entries with the first color so stray indices stay valid
+    colors += [colors[0]] * (256 - len(colors))
+    pal = Image.new('P', (1, 1))
+    pal.putpalette([channel for rgb in colors for channel in rgb])
+    return pal
+
+
+@lru_cache(maxsize=1)
+def _escapes_256() -> List[str]:
+    # Palette slot i is xterm color 16 + i; padding slots map to color 16
+    return [f"\x1b[38;5;{16 + i if i < 240 else 16}m" for i in range(256)]
+
+
+@lru_cache(maxsize=1)
+def _truecolor_lut() -> List[int]:
+    step = 1 << (8 - TRUECOLOR_BITS)
+    # Round to the nearest level, clamped to 255
+    return [min(255, (v + step // 2) // step * step) for v in range(256)] * 3
+
+
+def quantize_colors(img, mode: str) -> Sequence[int]:
+    """One color key per pixel of an RGB image: palette slot or packed RGB"""
+    from PIL import Image
+
+    if mode == '256':
+        return img.quantize(palette=palette_image(), dither=Image.Dither.NONE).tobytes()
+    if mode == 'truecolor':
+        packed = array('I')
+        packed.frombytes(img.point(_truecolor_lut()).convert('RGBX').tobytes())
+        return packed
+    raise ValueError(f"Unknown color mode '{mode}'")
+
+
+def color_rgb(key: int, mode: str) -> Tuple[int, int, int]:
+    """RGB value of a color key from quantize_colors"""
+    if mode == '256':
+        colors = xterm_palette()
+        return colors[key] if key < len(colors) else colors[0]
+    # RGBX pixels read as little-endian 32-bit integers
+    return (key & 0xFF, (key >> 8) & 0xFF, (key >> 16) & 0xFF)
+
+
+def color_escape(key: int, mode: str) -> str:
+    if mode == '256':
+        return _escapes_256()[key]
+    r, g, b = color_rgb(key, mode)
+    return f"\x1b[38;2;{r};{g};{b}m"
+
+
+def color_runs(row_colors: Sequence[int]) -> Iterator[Tuple[int, int]]:
+    """(color key, run length) for runs of equal adjacent colors"""
+    for key, run in groupby(row_colors):
+        yield key, sum(1 for _ in run)
+
+
+def ansi_rows(text: str, colors: Sequence[int], width: int, mode: str) -> Iterator[str]:
+    """Yield colored rows, switching color only where it changes"""
+    escapes = {}
+    for start in range(0, len(text), width):
+        parts = []
+        x = start
+        for key, length in color_runs(colors[start:start + width]):
+            escape = escapes.get(key)
+            if escape is None:
+                escape = escapes[key] = color_escape(key, mode)
+            parts.append(escape)
+            parts.append(text[x:x + length])
+            x += length
+        parts.append(RESET)
+        yield "".join(parts)
@@ -0,0 +1,45 @@
+"""
+Ordered (Bayer matrix) dithering for the brightness ramp.
+With only a handful of characters, smooth gradients collapse into bands.
+Adding a tiled Bayer threshold, scaled to one character step, to the
+resized grayscale pixels before the lookup turns each band edge into a
+fine pattern whose average matches the original brightness.
+"""
+
+from functools import lru_cache
+
+from ascii_generator import require_numpy
+
+
+# Side of the Bayer matrix (a power of two)
+BAYER_SIZE = 4
+
+
+@lru_cache(maxsize=4)
+def bayer_matrix(size: int = BAYER_SIZE):
+    """Bayer index matrix with values 0 .. size*size - 1"""
+    np = require_numpy()
+    matrix = np.zeros((1, 1), dtype=np.int32)
+    while matrix.shape[0] < size:
+        matrix = np.block([[4 * matrix, 4 * matrix + 2],
+                           [4 * matrix + 3, 4 * matrix + 1]])
+    return matrix
+
+
+@lru_cache(maxsize=32)
+def threshold_offsets(levels: int, size: int = BAYER_SIZE):
+    """Pixel offsets for a ramp of levels characters: thresholds spread
+    evenly over one character step (255 / (levels - 1))"""
+    np = require_numpy()
+    step = 255.0 / max(1, levels - 1)
+    thresholds = (bayer_matrix(size) + 0.5) / (size * size)
+    return np.round(thresholds * step).astype(np.int16)
+
+
+def ordered_dither(pixels, levels: int, size: int = BAYER_SIZE):
+    """Dithered copy of a uint8 grayscale array, ready for the character lookup"""
+    np = require_numpy()
+    height, width = pixels.shape
+    offsets = threshold_offsets(levels, size)
+    tiled = np.tile(offsets, (-(-height // size), -(-width // size)))[:height, :width]
+    return np.clip(pixels.astype(np.int16) + tiled, 0, 255).astype(np.uint8)
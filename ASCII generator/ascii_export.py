@@ -0,0 +1,154 @@
+"""
+HTML and SVG export of ASCII art.
+Rows are taken as the renderer produces them, ANSI color escapes included,
+and split into runs of identically colored characters. Each run becomes a
+single <span> (HTML) or <tspan> (SVG) and every distinct color gets a short
+CSS class, so a colored render costs a few bytes per color change rather
+than a full style attribute per character.
+"""
+
+import os
+import re
+from html import escape
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from ascii_color import xterm_rgb
+
+
+EXPORT_FORMATS = ('html', 'svg')
+EXPORT_EXTENSIONS = {'.html': 'html', '.htm': 'html', '.svg': 'svg'}
+
+# SVG text metrics in pixels; monospace glyphs advance about 0.6em
+FONT_SIZE = 12
+CHAR_WIDTH = 0.6 * FONT_SIZE
+
+# Select Graphic Rendition escapes (the only ones the renderer emits)
+SGR = re.compile(r'\x1b\[([0-9;]*)m')
+
+# (CSS color or None for the default, text)
+Run = Tuple[Optional[str], str]
+
+
+class StyleClasses(dict):
+    """CSS class name per color, assigned on first use"""
+
+    def __missing__(self, color: str) -> str:
+        name = self[color] = f"c{len(self)}"
+        return name
+
+    def rules(self, prop: str) -> str:
+        return "".join(f".{name}{{{prop}:{color}}}" for color, name in self.items())
+
+
+def export_format(path: str) -> Optional[str]:
+    """Export format implied by a file name, or None for plain text"""
+    return EXPORT_EXTENSIONS.get(os.path.splitext(path)[1].lower())
+
+
+def hex_color(rgb: Tuple[int, int, int]) -> str:
+    return "#%02x%02x%02x" % rgb
+
+
+def sgr_color(params: str, color: Optional[str]) -> Optional[str]:
+    """Foreground color after applying one SGR escape's parameters"""
+    codes = [int(p) if p else 0 for p in params.split(';')]
+    i = 0
+    while i < len(codes):
+        code = codes[i]
+        if code in (0, 39):
+            color = None
+        elif code == 38 and codes[i + 1:i + 2] == [5] and i + 2 < len(codes):
+            color = hex_color(xterm_rgb(codes[i + 2]))
+            i += 2
+        elif code == 38 and codes[i + 1:i + 2] == [2] and i + 4 < len(codes):
+            color = hex_color(tuple(codes[i + 2:i + 5]))
+            i += 4
+        i += 1
+    return color
+
+
+def row_runs(row: str) -> List[Run]:
+    """Runs of equally colored text in a row, escapes removed"""
+    runs: List[Run] = []
+    color = None
+    pos = 0
+
+    def add(text: str):
+        if not text:
+            return
+        # Blanks show no color, so they join the run before them
+        if runs and (runs[-1][0] == color or text.isspace()):
+            runs[-1] = (runs[-1][0], runs[-1][1] + text)
+        else:
+            runs.append((color, text))
+
+    for match in SGR.finditer(row):
+        add(row[pos:match.start()])
+        color = sgr_color(match.group(1), color)
+        pos = match.end()
+    add(row[pos:])
+    return runs
+
+
+def markup_row(runs: List[Run], classes: StyleClasses, tag: str) -> str:
+    parts = []
+    for color, text in runs:
+        text = escape(text, quote=False)
+        if color is None:
+            parts.append(text)
+        else:
+            parts.append(f'<{tag} class="{classes[color]}">{text}</{tag}>')
+    return "".join(parts)
+
+
+def html_document(rows: Iterable[str], title: str = "ASCII Art") -> Iterator[str]:
+    """Lines of a standalone HTML page, produced as rows arrive"""
+    classes = StyleClasses()
+    yield "<!DOCTYPE html>"
+    yield "<html>"
+    yield f'<head><meta charset="utf-8"><title>{escape(title)}</title></head>'
+    yield '<body style="background:#fff;color:#000">'
+    # A newline right after <pre> is dropped by the parser
+    yield '<pre style="font-family:monospace;line-height:1.0">'
+    for row in rows:
+        yield markup_row(row_runs(row), classes, 'span')
+    yield "</pre>"
+    # Colors are only known once every row is out
+    if classes:
+        yield f"<style>{classes.rules('color')}</style>"
+    yield "</body>"
+    yield "</html>"
+
+
+def svg_document(rows: Iterable[str], title: str = "ASCII Art") -> Iterator[str]:
+    """Lines of a standalone SVG image (rows are collected first, since the
+    canvas size comes before them)"""
+    lines = [row_runs(row) for row in rows]
+    columns = max((sum(len(text) for _, text in runs) for runs in lines), default=0)
+    width, height = round(columns * CHAR_WIDTH), len(lines) * FONT_SIZE
+
+    classes = StyleClasses()
+    body = []
+    for i, runs in enumerate(lines):
+        if runs:
+            # Baseline sits about 0.8em below the top of the line
+            y = round((i + 0.8) * FONT_SIZE, 1)
+            body.append(f'<text y="{y:g}">{markup_row(runs, classes, "tspan")}</text>')
+
+    yield (f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+           f'viewBox="0 0 {width} {height}" xml:space="preserve">')
+    yield f"<title>{escape(title)}</title>"
+    yield (f"<style>text{{font:{FONT_SIZE}px monospace;white-space:pre}}"
+           f"{classes.rules('fill')}</style>")
+    yield '<rect width="100%" height="100%" fill="#fff"/>'
+    yield from body
+    yield "</svg>"
+
+
+def export_rows(rows: Iterable[str], fmt: str, title: str = "ASCII Art") -> Iterator[str]:
+    """Lines of rows exported as fmt ('html' or 'svg')"""
+    if fmt == 'html':
+        return html_document(rows, title)
+    if fmt == 'svg':
+        return svg_document(rows, title)
+    raise ValueError(f"Unknown export format '{fmt}'")
@@ -0,0 +1,115 @@
+"""
+Precompiled bundle of the curated figlet fonts.
+pyfiglet parses a font file every time a font is loaded; the bundle keeps
+the parsed glyph tables for every font in text_fonts in one compressed
+file that loads with a single read.
+File format: header (magic, version), then zlib-compressed marshal data
+{'pyfiglet': version, 'fonts': {name: parsed font attributes}}.
+example usage: python ascii_fonts.py   (rebuilds text_fonts.bundle)
+"""
+
+import os
+import sys
+import zlib
+import struct
+import marshal
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+
+import pyfiglet
+
+
+MAGIC = b"AFNT"
+VERSION = 1
+HEADER = "<4sI"
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+BUNDLE_PATH = os.path.join(script_dir, "text_fonts.bundle")
+
+# FigletFont attributes needed for rendering (the raw font text is dropped)
+FONT_FIELDS = ('font', 'comment', 'chars', 'width', 'height',
+               'hardBlank', 'printDirection', 'smushMode')
+
+
+def build_bundle(fonts: Iterable[str], path: str = BUNDLE_PATH) -> Dict[str, pyfiglet.FigletFont]:
+    """Parse fonts and write them to a bundle file"""
+    parsed = {name: pyfiglet.FigletFont(name) for name in fonts}
+    payload = {
+        'pyfiglet': pyfiglet.__version__,
+        'fonts': {name: {field: getattr(font, field) for field in FONT_FIELDS}
+                  for name, font in parsed.items()}
+    }
+    data = zlib.compress(marshal.dumps(payload), 9)
+    # Write to a temp file first so readers never see a partial bundle;
+    # the pid keeps concurrent rebuilds from sharing one temp file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(struct.pack(HEADER, MAGIC, VERSION) + data)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return parsed
+
+
+def load_bundle(path: str = BUNDLE_PATH) -> Optional[Dict[str, pyfiglet.FigletFont]]:
+    """Read a bundle, or None if it is missing or from another pyfiglet version"""
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+    except OSError:
+        return None
+
+    header_size = struct.calcsize(HEADER)
+    try:
+        magic, version = struct.unpack_from(HEADER, raw)
+        if magic != MAGIC or version != VERSION:
+            return None
+        payload = marshal.loads(zlib.decompress(raw[header_size:]))
+    except (struct.error, zlib.error, ValueError, EOFError, TypeError):
+        return None
+    if payload.get('pyfiglet') != pyfiglet.__version__:
+        return None
+
+    fonts = {}
+    for name, fields in payload['fonts'].items():
+        # Rebuild the font object without parsing the font file again
+        font = pyfiglet.FigletFont.__new__(pyfiglet.FigletFont)
+        font.__dict__.update(fields)
+        font.data = None
+        fonts[name] = font
+    return fonts
+
+
+@lru_cache(maxsize=1)
+def bundled_fonts(names: tuple) -> Dict[str, pyfiglet.FigletFont]:
+    """Parsed fonts for names, from the bundle (rebuilt when unusable)"""
+    fonts = load_bundle()
+    if fonts is not None and all(name in fonts for name in names):
+        return fonts
+    try:
+        return build_bundle(names)
+    except OSError:
+        # Read-only install: parse in memory only
+        return {name: pyfiglet.FigletFont(name) for name in names}
+
+
+class BundledFiglet(pyfiglet.Figlet):
+    """Figlet renderer using an already parsed font"""
+
+    def __init__(self, font: pyfiglet.FigletFont, width: int = 80):
+        self._parsed_font = font
+        super().__init__(font=font.font, width=width)
+
+    def setFont(self, **kwargs):
+        self.Font = self._parsed_font
+
+
+if __name__ == "__main__":
+    from ascii_generator import TEXT_FONTS
+
+    path = sys.argv[1] if len(sys.argv) > 1 else BUNDLE_PATH
+    build_bundle(TEXT_FONTS, path)
+    print(f"✅ Bundled {len(TEXT_FONTS)} fonts into {path} ({os.path.getsize(path):,} bytes)")
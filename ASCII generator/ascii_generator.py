@@ -8,11 +8,161 @@
 # python ascii_generator.py --help-detailed
 
 import os
+import re
 import sys
 import argparse
-from PIL import Image
-import pyfiglet
-from typing import Optional, List
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, List
+
+# PIL and pyfiglet are imported where first needed, so info commands
+# such as --list-fonts start without loading them
+
+from ascii_color import COLOR_MODES
+
+
+# Resampling filters selectable for the final resize (PIL Image.Resampling names)
+RESAMPLE_FILTERS = {
+    'nearest': 'NEAREST',
+    'box': 'BOX',
+    'bilinear': 'BILINEAR',
+    'hamming': 'HAMMING',
+    'bicubic': 'BICUBIC',
+    'lanczos': 'LANCZOS',
+}
+
+# brightness: one character per pixel from the char set ramp
+# braille: one Braille pattern per 2x4 pixel block (needs numpy)
+# shape: char set glyph whose shape best matches each cell (needs numpy)
+RENDER_MODES = ('brightness', 'braille', 'shape')
+
+# Curated figlet fonts (precompiled into text_fonts.bundle)
+TEXT_FONTS = (
+    'slant', 'big', 'block', 'bubble', 'digital', 'isometric1',
+    'letters', 'alligator', 'banner', 'doom', 'epic', 'ghost',
+    'graffiti', 'hollywood', 'invita', 'lean', 'mini', 'script',
+    'shadow', 'small', 'smscript', 'speed', 'starwars', 'stop',
+    'thick', 'thin', 'univers'
+)
+
+# File types picked up from image directories
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp', '.tif', '.tiff'}
+
+# Reduced decodes stay at least this many times larger than the target
+# so the final filter still has detail to work with
+REDUCE_GAP = 2
+
+# Sources above this many pixels are read in bands when their format allows
+TILED_MIN_PIXELS = 50_000_000
+# Dot threshold for Braille when the image mean is not known up front
+BRAILLE_THRESHOLD = 128
+
+# Character rows rendered per band when streaming output
+BAND_ROWS = 64
+# Output buffer for streamed rows
+WRITE_BUFFER = 1 << 20
+
+# Parsed figlet fonts and rendered text kept per process
+FONT_CACHE_SIZE = 64
+RENDER_CACHE_SIZE = 1024
+
+# Color escape sequences take no space on screen
+# (compiled on first use by the re module cache)
+ANSI_ESCAPE = r'\x1b\[[0-9;?]*[A-Za-z]'
+
+
+@lru_cache(maxsize=32)
+def build_char_lookup(chars: str):
+    """Precompute the character for each of the 256 brightness levels"""
+    lookup = [chars[int(pixel / 255 * (len(chars) - 1))] for pixel in range(256)]
+    if chars.isascii():
+        # bytes.translate table: grayscale byte -> ASCII byte
+        return bytes(ord(c) for c in lookup)
+    # str.translate table for multi-byte characters (e.g. block elements)
+    return {pixel: c for pixel, c in enumerate(lookup)}
+
+
+def map_pixels(data: bytes, chars: str) -> str:
+    """Convert 8-bit grayscale pixels to characters using a 256-entry lookup"""
+    lookup = build_char_lookup(chars)
+    if isinstance(lookup, bytes):
+        return data.translate(lookup).decode('ascii')
+    # latin-1 maps each byte to the code point of the same value
+    return data.decode('latin-1').translate(lookup)
+
+
+@lru_cache(maxsize=FONT_CACHE_SIZE)
+def figlet_renderer(font: str, width: int):
+    """Figlet instance for (font, width); the font file is parsed only once"""
+    import pyfiglet
+    from ascii_fonts import BundledFiglet, bundled_fonts
+    
+    # Curated fonts come pre-parsed from the bundle
+    fonts = bundled_fonts(TEXT_FONTS)
+    if font in fonts:
+        return BundledFiglet(fonts[font], width)
+    return pyfiglet.Figlet(font=font, width=width)
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def render_text(text: str, font: str, width: int) -> str:
+    """Rendered figlet text, cached on (text, font, width)"""
+    return figlet_renderer(font, width).renderText(text)
+
+
+def require_numpy():
+    """Import numpy for the array-based render modes, with an install hint"""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("This render mode needs numpy. Install it with: pip install numpy") from None
+    return numpy
+
+
+def visible_length(line: str) -> int:
+    """On-screen width of a row, not counting color escape sequences"""
+    return len(re.sub(ANSI_ESCAPE, '', line))
+
+
+def write_rows(rows: Iterable[str], out=None, buffer_size: int = WRITE_BUFFER) -> int:
+    """Write rows, newline-terminated, to out (default stdout) in chunks of
+    about buffer_size characters; returns the number of rows written"""
+    out = out or sys.stdout
+    chunk = []
+    size = 0
+    count = 0
+    for row in rows:
+        chunk.append(row)
+        size += len(row) + 1
+        count += 1
+        if size >= buffer_size:
+            chunk.append("")
+            out.write("\n".join(chunk))
+            chunk = []
+            size = 0
+    if chunk:
+        chunk.append("")
+        out.write("\n".join(chunk))
+    out.flush()
+    return count
+
+
+def open_image(path: str):
+    """Open an image; sources above Pillow's decompression bomb limit are
+    accepted only when they can be read in bands"""
+    from PIL import Image
+    
+    try:
+        return Image.open(path)
+    except Image.DecompressionBombError:
+        # Bands are decoded by reopening the file, so only paths qualify
+        if not isinstance(path, str):
+            raise
+        from ascii_tiles import open_unchecked, raw_row_tiles
+        img = open_unchecked(path)
+        if raw_row_tiles(img) is None:
+            img.close()
+            raise
+        return img
 
 
 class ASCIIArtGenerator:
@@ -25,17 +175,13 @@ class ASCIIArtGenerator:
             'detailed': "@%#*+=-:. ",
             'simple': "█▉▊▋▌▍▎▏ ",
             'classic': "#*+=-:. ",
-            'minimal': "█░ "
+            'minimal': "█░ ",
+            # Line glyphs for the shape render mode
+            'shapes': "@#%*+=|/\\()<>-_^:,.'` "
         }
         
         # Available figlet fonts
-        self.text_fonts = [
-            'slant', 'big', 'block', 'bubble', 'digital', 'isometric1',
-            'letters', 'alligator', 'banner', 'doom', 'epic', 'ghost',
-            'graffiti', 'hollywood', 'invita', 'lean', 'mini', 'script',
-            'shadow', 'small', 'smscript', 'speed', 'starwars', 'stop',
-            'thick', 'thin', 'univers'
-        ]
+        self.text_fonts = list(TEXT_FONTS)
     
     def text_to_ascii(self, text: str, font: str = 'slant', width: int = 80) -> str:
         """Convert text to ASCII art using figlet"""
@@ -46,49 +192,138 @@ class ASCIIArtGenerator:
                 font = 'slant'
             
             # Generate ASCII art
-            ascii_art = pyfiglet.figlet_format(text, font=font, width=width)
+            ascii_art = render_text(text, font, width)
             return ascii_art
             
         except Exception as e:
             return f"❌ Error generating text ASCII: {str(e)}"
     
+    def prepare_image(self, img, width: int, resample: str = 'bicubic',
+                      mode: str = 'L', cell: tuple = (1, 1)):
+        """Decode an opened image at the smallest useful scale and resize it
+        to the ASCII grid (width columns, height halved for tall characters),
+        with cell = (columns, rows) pixels per character"""
+        if resample not in RESAMPLE_FILTERS:
+            raise ValueError(f"Unknown resampling filter '{resample}'")
+        
+        # Calculate new dimensions from the full-size header
+        aspect_ratio = img.height / img.width
+        # ASCII characters are roughly twice as tall as wide
+        height = int(width * aspect_ratio * 0.5)
+        width, height = width * cell[0], height * cell[1]
+        
+        # JPEG: let the decoder scale down by 1/2, 1/4 or 1/8 while decoding
+        # (no-op for other formats)
+        img.draft(mode, (width * REDUCE_GAP, height * REDUCE_GAP))
+        img = img.convert(mode)
+        
+        # Other formats: cheap integer box reduction before the final filter
+        factor = min(img.width // max(1, width * REDUCE_GAP),
+                     img.height // max(1, height * REDUCE_GAP))
+        if factor > 1:
+            img = img.reduce(factor)
+        
+        from PIL import Image
+        
+        return img.resize((width, height), resample=getattr(Image.Resampling, RESAMPLE_FILTERS[resample]))
+    
+    def iter_rows(self, img, width: int = 80, char_set: str = 'detailed',
+                  resample: str = 'bicubic', color: Optional[str] = None,
+                  render_mode: str = 'brightness', dither: bool = False) -> Iterator[str]:
+        """Yield the rows of an opened image rendered as ASCII art, a band
+        of rows at a time so the full text is never held in memory"""
+        if render_mode not in RENDER_MODES:
+            raise ValueError(f"Unknown render mode '{render_mode}'")
+        if color and color not in COLOR_MODES:
+            raise ValueError(f"Unknown color mode '{color}'")
+        
+        # Get character set
+        chars = self.char_sets.get(char_set, self.char_sets['detailed'])
+        # Decoded in RGB only when colors are kept per cell
+        mode = 'RGB' if color else 'L'
+        
+        if render_mode == 'braille':
+            from ascii_braille import BRAILLE_CELL as cell, braille_masks, braille_glyphs
+            from PIL import ImageStat
+            np = require_numpy()
+        elif render_mode == 'shape':
+            from ascii_shapes import SHAPE_CELL as cell, glyph_set, match_glyphs
+            np = require_numpy()
+            glyphs = glyph_set(chars)
+        else:
+            cell = (1, 1)
+            if dither:
+                from ascii_dither import ordered_dither
+                np = require_numpy()
+        if color:
+            from ascii_color import quantize_colors, ansi_rows
+        
+        tiles = None
+        if img.width * img.height > TILED_MIN_PIXELS:
+            from ascii_tiles import raw_row_tiles, tiled_bands
+            tiles = raw_row_tiles(img)
+        
+        if tiles:
+            # Huge uncompressed source: decode and area-average a band at a time
+            bands = tiled_bands(img, tiles, width, mode, cell, BAND_ROWS)
+            threshold = BRAILLE_THRESHOLD
+        else:
+            # Decode at reduced scale and resize to the character grid
+            img = self.prepare_image(img, width, resample, mode, cell)
+            if render_mode == 'braille':
+                # One dot threshold for the whole image, not per band
+                threshold = ImageStat.Stat(img.convert('L')).mean[0]
+            # Bands are a multiple of every cell height and of the dither matrix
+            band_height = BAND_ROWS * cell[1]
+            bands = (img.crop((0, top, img.width, min(top + band_height, img.height)))
+                     for top in range(0, img.height, band_height))
+        
+        for band in bands:
+            gray = band.convert('L') if color else band
+            
+            if render_mode == 'braille':
+                text = braille_glyphs(braille_masks(np.asarray(gray), threshold))
+            elif render_mode == 'shape':
+                # Cells sampled at glyph feature resolution, matched in one matrix product
+                text = match_glyphs(np.asarray(gray), glyphs)
+            else:
+                data = gray.tobytes()
+                if dither:
+                    # Bayer thresholds break bands between ramp characters
+                    data = ordered_dither(np.asarray(gray), len(chars)).tobytes()
+                # Map every pixel through the lookup table in one pass
+                text = map_pixels(data, chars)
+            
+            if color:
+                # Keep RGB per cell (block averages); characters follow brightness
+                rgb = band.reduce(cell) if cell != (1, 1) else band
+                yield from ansi_rows(text, quantize_colors(rgb, color), width, color)
+            else:
+                for i in range(0, len(text), width):
+                    yield text[i:i + width]
+    
+    def render_image(self, img, width: int = 80, char_set: str = 'detailed',
+                     resample: str = 'bicubic', color: Optional[str] = None,
+                     render_mode: str = 'brightness', dither: bool = False) -> str:
+        """Convert an opened image (or animation frame) to ASCII art,
+        optionally colored with ANSI escapes ('256' or 'truecolor') and
+        ordered-dithered (brightness mode)"""
+        return "\n".join(self.iter_rows(img, width, char_set, resample, color,
+                                        render_mode, dither))
+    
     def image_to_ascii(self, image_path: str, width: int = 80, 
-                      char_set: str = 'detailed') -> str:
+                      char_set: str = 'detailed', resample: str = 'bicubic',
+                      color: Optional[str] = None, render_mode: str = 'brightness',
+                      dither: bool = False) -> str:
         """Convert image to ASCII art"""
         try:
             # Check if file exists
             if not os.path.exists(image_path):
                 return f"❌ Image file not found: {image_path}"
             
-            # Get character set
-            chars = self.char_sets.get(char_set, self.char_sets['detailed'])
-            
             # Open and process image
-            with Image.open(image_path) as img:
-                # Convert to grayscale
-                img = img.convert('L')
-                
-                # Calculate new dimensions
-                aspect_ratio = img.height / img.width
-                # ASCII characters are roughly twice as tall as wide
-                height = int(width * aspect_ratio * 0.5)
-                
-                # Resize image
-                img = img.resize((width, height))
-                
-                # Convert to ASCII
-                ascii_lines = []
-                for y in range(height):
-                    line = ""
-                    for x in range(width):
-                        # Get pixel brightness (0-255)
-                        pixel = img.getpixel((x, y))
-                        # Map brightness to character index
-                        char_index = int(pixel / 255 * (len(chars) - 1))
-                        line += chars[char_index]
-                    ascii_lines.append(line)
-                
-                return "\n".join(ascii_lines)
+            with open_image(image_path) as img:
+                return self.render_image(img, width, char_set, resample, color, render_mode, dither)
                 
         except Exception as e:
             return f"❌ Error processing image: {str(e)}"
@@ -121,7 +356,7 @@ class ASCIIArtGenerator:
         
         for font in sample_fonts:
             try:
-                ascii_text = pyfiglet.figlet_format(sample_text, font=font, width=60)
+                ascii_text = render_text(sample_text, font, 60)
                 preview += f"\n--- {font.upper()} ---\n"
                 preview += ascii_text
             except:
@@ -132,30 +367,39 @@ class ASCIIArtGenerator:
         
         return preview
     
-    def create_banner(self, text: str, char: str = "=", width: int = 60) -> str:
-        """Create a decorative banner around text"""
-        lines = text.split('\n')
-        max_length = max(len(line) for line in lines) if lines else 0
-        
+    def banner_rows(self, rows: Iterable[str], content_width: int, char: str = "=",
+                    width: int = 60) -> Iterator[str]:
+        """Frame rows one at a time; content_width is the widest visible row"""
         # Ensure width is at least as wide as the content
-        if width < max_length + 4:
-            width = max_length + 4
+        if width < content_width + 4:
+            width = content_width + 4
         
         # Top border
-        banner = char * width + "\n"
+        yield char * width
         
         # Content with padding
-        for line in lines:
-            padding = (width - len(line) - 2) // 2
-            banner += char + " " * padding + line + " " * (width - len(line) - padding - 2) + char + "\n"
+        for line in rows:
+            length = visible_length(line)
+            padding = (width - length - 2) // 2
+            yield char + " " * padding + line + " " * (width - length - padding - 2) + char
         
         # Bottom border
-        banner += char * width
-        
-        return banner
+        yield char * width
+    
+    def create_banner(self, text: str, char: str = "=", width: int = 60) -> str:
+        """Create a decorative banner around text"""
+        lines = text.split('\n')
+        max_length = max(visible_length(line) for line in lines) if lines else 0
+        return "\n".join(self.banner_rows(lines, max_length, char, width))
     
     def save_to_file(self, content: str, filename: str) -> bool:
-        """Save ASCII art to file"""
+        """Save ASCII art to file (as HTML or SVG for .html/.htm/.svg names)"""
+        from ascii_export import export_format, export_rows
+        
+        fmt = export_format(filename)
+        if fmt:
+            title = os.path.basename(filename)
+            content = "\n".join(export_rows(content.split("\n"), fmt, title)) + "\n"
         try:
             with open(filename, 'w', encoding='utf-8') as f:
                 f.write(content)
@@ -187,12 +431,36 @@ def show_help():
   python ascii_generator.py image photo.jpg
   python ascii_generator.py image logo.png --width 120
   python ascii_generator.py image pic.jpg --chars simple
+  python ascii_generator.py image photo.jpg --color truecolor --width 300
+  python ascii_generator.py image photo.jpg --mode braille
+  python ascii_generator.py image logo.png --mode shape --width 200
+  python ascii_generator.py image sky.jpg --chars minimal --dither
+  python ascii_generator.py image photo.jpg --color truecolor --output photo.html
+  python ascii_generator.py image logo.png --color 256 --output logo.svg
+
+🎞️ ANIMATION:
+  python ascii_generator.py animate dance.gif
+  python ascii_generator.py animate frames_dir --fps 24 --loop 0
+
+📁 IMAGE DIRECTORY:
+  python ascii_generator.py image-dir photos/ ascii_out/
+  python ascii_generator.py image-dir assets/ out/ --format html --workers 8
+  python ascii_generator.py image-dir assets/ out/ --format svg --color 256
 
 📋 OPTIONS:
   --font FONT       Font for text (default: slant)
   --width WIDTH     Output width (default: 80)
   --chars CHARSET   Character set for images (detailed/simple/classic/minimal)
-  --output FILE     Save to file instead of printing
+  --resample FILTER Resize filter for images (nearest/box/bilinear/hamming/bicubic/lanczos)
+  --color MODE      ANSI color for images (256/truecolor)
+  --mode MODE       Image render mode (brightness/braille/shape; braille and shape need numpy)
+  --dither          Ordered dithering between ramp characters (needs numpy)
+  --fps FPS         Playback rate for animations (default: from file)
+  --loop N          Animation repeats, 0 = forever (default: 1)
+  --format FORMAT   Output format for image-dir (txt/ansi/html/svg)
+  --workers N       Worker processes for image-dir (default: CPU count)
+  --force           Convert even when outputs are up to date
+  --output FILE     Save to file instead of printing (.html/.svg keep colors)
   --banner          Add decorative border
   --list-fonts      Show available fonts
   --list-chars      Show character set previews
@@ -245,10 +513,52 @@ def main():
     image_parser.add_argument('image_path', help='Path to image file')
     image_parser.add_argument('--width', type=int, default=80, help='Output width (default: 80)')
     image_parser.add_argument('--chars', default='detailed', help='Character set (default: detailed)')
+    image_parser.add_argument('--resample', default='bicubic', choices=list(RESAMPLE_FILTERS),
+                              help='Resampling filter (default: bicubic)')
+    image_parser.add_argument('--color', choices=COLOR_MODES,
+                              help='ANSI color output: 256 or truecolor (default: none)')
+    image_parser.add_argument('--mode', default='brightness', choices=RENDER_MODES,
+                              help='Render mode: brightness, braille or shape (default: brightness)')
+    image_parser.add_argument('--dither', action='store_true',
+                              help='Ordered dithering for smoother gradients (brightness mode)')
+    
+    # Animation command
+    animate_parser = subparsers.add_parser('animate', help='Play an animated image or frame directory')
+    animate_parser.add_argument('source', help='Animated GIF/APNG/WebP or a directory of frames')
+    animate_parser.add_argument('--width', type=int, default=80, help='Output width (default: 80)')
+    animate_parser.add_argument('--chars', default='detailed', help='Character set (default: detailed)')
+    animate_parser.add_argument('--resample', default='bicubic', choices=list(RESAMPLE_FILTERS),
+                                help='Resampling filter (default: bicubic)')
+    animate_parser.add_argument('--mode', default='brightness', choices=RENDER_MODES,
+                                help='Render mode: brightness, braille or shape (default: brightness)')
+    animate_parser.add_argument('--dither', action='store_true',
+                                help='Ordered dithering for smoother gradients (brightness mode)')
+    animate_parser.add_argument('--fps', type=float, help='Target frame rate (default: from file, else 10)')
+    animate_parser.add_argument('--loop', type=int, default=1, help='Times to play, 0 = forever (default: 1)')
+    
+    # Image directory command
+    dir_parser = subparsers.add_parser('image-dir', help='Convert a directory tree of images')
+    dir_parser.add_argument('source_dir', help='Directory of images (searched recursively)')
+    dir_parser.add_argument('output_dir', help='Directory for mirrored output files')
+    dir_parser.add_argument('--format', default='txt', choices=['txt', 'ansi', 'html', 'svg'],
+                            help='Output format (default: txt)')
+    dir_parser.add_argument('--width', type=int, default=80, help='Output width (default: 80)')
+    dir_parser.add_argument('--chars', default='detailed', help='Character set (default: detailed)')
+    dir_parser.add_argument('--resample', default='bicubic', choices=list(RESAMPLE_FILTERS),
+                            help='Resampling filter (default: bicubic)')
+    dir_parser.add_argument('--color', choices=COLOR_MODES,
+                            help='Color mode (default: 256 for ansi, none for html/svg)')
+    dir_parser.add_argument('--mode', default='brightness', choices=RENDER_MODES,
+                            help='Render mode: brightness, braille or shape (default: brightness)')
+    dir_parser.add_argument('--dither', action='store_true',
+                            help='Ordered dithering for smoother gradients (brightness mode)')
+    dir_parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    dir_parser.add_argument('--force', action='store_true', help='Convert even if outputs are up to date')
     
     # Common options
     for subparser in [text_parser, image_parser]:
-        subparser.add_argument('--output', help='Save to file instead of printing')
+        subparser.add_argument('--output',
+                               help='Save to file instead of printing (.html/.svg export a page or image)')
         subparser.add_argument('--banner', action='store_true', help='Add decorative border')
     
     # Info commands
@@ -292,35 +602,88 @@ def main():
         print("\n📖 For detailed help: python ascii_generator.py --help-detailed")
         return
     
+    if args.command == 'animate':
+        from ascii_animation import ASCIIAnimationPlayer, format_stats
+        
+        if not os.path.exists(args.source):
+            print(f"❌ Animation source not found: {args.source}")
+            return
+        player = ASCIIAnimationPlayer(generator, args.width, args.chars, args.resample,
+                                      args.fps, args.loop, render_mode=args.mode,
+                                      dither=args.dither)
+        stats = player.play(args.source)
+        print(format_stats(stats))
+        return
+    
+    if args.command == 'image-dir':
+        from ascii_batch import convert_tree, format_stats
+        
+        if not os.path.isdir(args.source_dir):
+            print(f"❌ Directory not found: {args.source_dir}")
+            return
+        print(f"📁 Converting images in '{args.source_dir}' -> '{args.output_dir}' ({args.format})")
+        stats = convert_tree(args.source_dir, args.output_dir, args.format, args.width,
+                             args.chars, args.resample, args.color, args.workers, args.force,
+                             args.mode, args.dither)
+        print(format_stats(stats))
+        return
+    
     print_banner()
     
     # Process commands
-    result = ""
-    
     if args.command == 'text':
         print(f"🔤 Converting text: '{args.text}'")
         print(f"📝 Font: {args.font}, Width: {args.width}")
         result = generator.text_to_ascii(args.text, args.font, args.width)
+        if result.startswith('❌'):
+            print(result)
+            return
+        lines = result.split('\n')
+        output_rows(generator, args, lines, max(visible_length(line) for line in lines))
     
     elif args.command == 'image':
         print(f"🖼️ Converting image: '{args.image_path}'")
         print(f"📐 Width: {args.width}, Character set: {args.chars}")
-        result = generator.image_to_ascii(args.image_path, args.width, args.chars)
-    
+        if not os.path.exists(args.image_path):
+            print(f"❌ Image file not found: {args.image_path}")
+            return
+        
+        try:
+            # Rows are rendered band by band and streamed straight to the output
+            with open_image(args.image_path) as img:
+                rows = generator.iter_rows(img, args.width, args.chars, args.resample,
+                                           args.color, args.mode, args.dither)
+                output_rows(generator, args, rows, args.width)
+        except Exception as e:
+            print(f"❌ Error processing image: {str(e)}")
+
+
+def output_rows(generator: ASCIIArtGenerator, args, rows: Iterable[str], content_width: int):
+    """Frame rows if requested and stream them to the output file or stdout"""
     # Add banner if requested
-    if args.banner and result and not result.startswith('❌'):
-        result = generator.create_banner(result)
+    if args.banner:
+        rows = generator.banner_rows(rows, content_width)
     
     # Output result
     if args.output:
-        if generator.save_to_file(result, args.output):
-            print(f"💾 ASCII art saved to: {args.output}")
-        else:
+        from ascii_export import export_format, export_rows
+        
+        fmt = export_format(args.output)
+        if fmt:
+            rows = export_rows(rows, fmt, os.path.basename(args.output))
+        try:
+            f = open(args.output, 'w', encoding='utf-8')
+        except OSError as e:
+            print(f"❌ Error saving file: {e}")
             print("❌ Failed to save file!")
+            return
+        with f:
+            write_rows(rows, f)
+        print(f"💾 ASCII art saved to: {args.output}")
     else:
         print(f"\n🎨 Result:")
         print("-" * 50)
-        print(result)
+        write_rows(rows)
         print("-" * 50)
 
 
@@ -0,0 +1,129 @@
+"""
+Glyph-shape matching renderer.
+The character set is rasterized once with a monospace font into small
+bitmaps whose pixels serve as feature vectors (cached on disk). Each image
+cell is sampled at the same resolution and matched to the nearest glyph
+for all cells at once with a single matrix multiplication, so edges pick
+characters like / | \\ _ instead of only following brightness.
+"""
+
+import os
+import hashlib
+from functools import lru_cache
+
+from ascii_generator import require_numpy
+
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(script_dir, ".glyph_cache")
+
+# Feature pixels per character cell (columns, rows)
+SHAPE_CELL = (4, 8)
+# Glyphs are drawn at this font size before being reduced to SHAPE_CELL
+RASTER_SIZE = 32
+# Weight of mean brightness against shape when matching; flat regions
+# then still follow the brightness ramp
+BRIGHTNESS_WEIGHT = 8.0
+# Monospace fonts tried in order before Pillow's built-in font
+FONT_CANDIDATES = ('DejaVuSansMono.ttf', 'Menlo.ttc', 'consola.ttf', 'cour.ttf')
+
+
+def shape_vectors(coverage):
+    """Matching vectors: coverage with its mean removed (shape), followed
+    by the weighted mean (brightness)"""
+    np = require_numpy()
+    means = coverage.mean(axis=1, keepdims=True)
+    return np.concatenate([coverage - means, BRIGHTNESS_WEIGHT * means], axis=1)
+
+
+class GlyphSet:
+    """Matching vectors of a character set, from glyph ink coverage"""
+
+    def __init__(self, chars: str, coverage):
+        np = require_numpy()
+        self.chars = chars
+        self.vectors = shape_vectors(coverage.astype(np.float32))
+        # Squared norms for nearest-neighbour search by dot product
+        self.half_norms = 0.5 * (self.vectors ** 2).sum(axis=1)
+        # Darkest image cells map to the inkiest glyph's coverage
+        self.max_ink = float(coverage.mean(axis=1).max()) or 1.0
+        self.table = {i: c for i, c in enumerate(chars)}
+
+
+def load_font():
+    """(font, name) for the first available monospace font"""
+    from PIL import ImageFont
+
+    for name in FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(name, RASTER_SIZE), name
+        except OSError:
+            continue
+    return ImageFont.load_default(RASTER_SIZE), 'default'
+
+
+def rasterize(chars: str, font):
+    """Array (len(chars), columns * rows) of glyph ink coverage"""
+    from PIL import Image, ImageDraw
+    np = require_numpy()
+
+    ascent, descent = font.getmetrics()
+    size = (max(1, round(font.getlength('M'))), ascent + descent)
+    features = []
+    for c in chars:
+        canvas = Image.new('L', size, 0)
+        ImageDraw.Draw(canvas).text((0, 0), c, fill=255, font=font)
+        # Box filter: each feature pixel is the ink coverage of its area
+        small = canvas.resize(SHAPE_CELL, Image.Resampling.BOX)
+        features.append(np.asarray(small, dtype=np.float32).ravel() / 255.0)
+    return np.stack(features)
+
+
+def cache_path(chars: str, font_name: str) -> str:
+    from PIL import __version__ as pil_version
+
+    key = repr((chars, font_name, SHAPE_CELL, RASTER_SIZE, pil_version))
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"glyphs-{digest}.npy")
+
+
+@lru_cache(maxsize=16)
+def glyph_set(chars: str) -> GlyphSet:
+    """Glyph features for chars, from the disk cache when possible"""
+    np = require_numpy()
+    font, font_name = load_font()
+    path = cache_path(chars, font_name)
+
+    try:
+        features = np.load(path)
+        if features.shape == (len(chars), SHAPE_CELL[0] * SHAPE_CELL[1]):
+            return GlyphSet(chars, features)
+    except (OSError, ValueError):
+        pass
+
+    features = rasterize(chars, font)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        np.save(path, features)
+    except OSError:
+        # Read-only install: keep the features in memory only
+        pass
+    return GlyphSet(chars, features)
+
+
+def match_glyphs(pixels, glyphs: GlyphSet) -> str:
+    """Nearest glyph for every cell of a grayscale array whose sides are
+    multiples of SHAPE_CELL, row after row"""
+    np = require_numpy()
+    columns, rows = SHAPE_CELL
+    height, width = pixels.shape
+
+    # One row per cell: darkness scaled to the glyphs' ink range
+    cells = (255 - pixels).reshape(height // rows, rows, width // columns, columns)
+    cells = cells.transpose(0, 2, 1, 3).reshape(-1, rows * columns)
+    cells = shape_vectors(cells.astype(np.float32) * (glyphs.max_ink / 255.0))
+
+    # argmin |c - g|^2 == argmax (c . g - |g|^2 / 2), for all cells at once
+    scores = cells @ glyphs.vectors.T - glyphs.half_norms
+    best = scores.argmax(axis=1).astype(np.uint8)
+    return best.tobytes().decode('latin-1').translate(glyphs.table)
@@ -0,0 +1,107 @@
+"""
+Delta terminal output for ASCII frames.
+Keeps the previous frame and writes only the runs of characters that
+changed, each preceded by a cursor-move escape sequence, batched into
+one write and one flush per frame.
+"""
+
+import sys
+from typing import List, Optional
+
+
+CLEAR_SCREEN = "\x1b[2J"
+ERASE_LINE_END = "\x1b[K"
+ERASE_BELOW = "\x1b[J"
+# Unchanged gaps shorter than this are rewritten rather than skipped,
+# since a cursor move costs about as many bytes
+MIN_GAP = 6
+
+
+def move_to(row: int, col: int) -> str:
+    """Cursor-position escape sequence (0-based arguments)"""
+    return f"\x1b[{row + 1};{col + 1}H"
+
+
+def changed_runs(old: str, new: str, min_gap: int = MIN_GAP) -> List[tuple]:
+    """(start, end) column ranges of new that differ from old, with close runs merged"""
+    runs = []
+    start = None
+    last_diff = -1
+    for x, (a, b) in enumerate(zip(old, new)):
+        if a != b:
+            if start is None:
+                start = x
+            elif x - last_diff > min_gap:
+                runs.append((start, last_diff + 1))
+                start = x
+            last_diff = x
+
+    # Anything past the end of the old row is new
+    if len(new) > len(old):
+        if start is not None and len(old) - last_diff <= min_gap:
+            last_diff = len(new) - 1
+        else:
+            if start is not None:
+                runs.append((start, last_diff + 1))
+            start = len(old)
+            last_diff = len(new) - 1
+
+    if start is not None:
+        runs.append((start, last_diff + 1))
+    return runs
+
+
+class DeltaRenderer:
+
+    def __init__(self, out=None, min_gap: int = MIN_GAP):
+        self.out = out or sys.stdout
+        self.min_gap = min_gap
+        self.previous: Optional[List[str]] = None
+        # Bytes actually written vs. what full redraws would have cost
+        self.bytes_written = 0
+        self.full_bytes = 0
+
+    def reset(self):
+        """Forget the previous frame so the next one is drawn in full"""
+        self.previous = None
+
+    def frame_delta(self, lines: List[str]) -> str:
+        """Escape sequences and text that turn the previous frame into this one"""
+        if self.previous is None:
+            return CLEAR_SCREEN + move_to(0, 0) + "\n".join(lines)
+
+        parts = []
+        previous = self.previous
+        for y, line in enumerate(lines):
+            old = previous[y] if y < len(previous) else ""
+            if line == old:
+                continue
+            for start, end in changed_runs(old, line, self.min_gap):
+                parts.append(move_to(y, start))
+                parts.append(line[start:end])
+            if len(line) < len(old):
+                parts.append(move_to(y, len(line)) + ERASE_LINE_END)
+
+        if len(lines) < len(previous):
+            parts.append(move_to(len(lines), 0) + ERASE_BELOW)
+
+        return "".join(parts)
+
+    def draw(self, text: str):
+        """Draw a frame with a single buffered write and flush"""
+        lines = text.split("\n")
+        delta = self.frame_delta(lines)
+        self.previous = lines
+
+        self.full_bytes += len((move_to(0, 0) + text).encode('utf-8'))
+        if delta:
+            self.out.write(delta)
+            self.out.flush()
+            self.bytes_written += len(delta.encode('utf-8'))
+
+    def finish(self):
+        """Leave the cursor at the start of the line below the last frame"""
+        if self.previous is None:
+            return
+        # Newline from the last row scrolls if the frame fills the screen
+        self.out.write(move_to(len(self.previous) - 1, 0) + "\n")
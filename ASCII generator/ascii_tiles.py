@@ -0,0 +1,155 @@
+"""
+Bounded-memory conversion of very large images.
+Uncompressed sources (TIFF without compression, BMP, PPM/PGM) store each
+pixel row at a known file offset, so a horizontal strip can be decoded on
+its own by reading just its bytes and unpacking them with Pillow's 'raw'
+decoder. Strips of at most MAX_BAND_PIXELS source pixels are shrunk to
+the grid width as they are decoded, then each band of grid rows is
+area-averaged from those reduced rows and rendered as it arrives, so
+memory is bounded by the strip size rather than by the source resolution
+or the output width.
+Compressed formats (PNG, compressed TIFF, WebP) decode sequentially in
+Pillow and cannot be read this way; JPEG is already decoded at reduced
+scale through draft().
+"""
+
+import math
+from typing import Iterator, List, Optional, Tuple
+
+from PIL import BmpImagePlugin, Image, PpmImagePlugin, TiffImagePlugin
+
+
+# Source pixels decoded at once (a hard cap, except that a strip always
+# holds at least one source row)
+MAX_BAND_PIXELS = 8_000_000
+# Bands hold a multiple of this many grid rows, so they line up with every
+# cell height (1, 4, 8) and with the dither matrix; only width-reduced
+# rows are kept for a band, so this does not widen the decoded strips
+ROW_ALIGN = 8
+
+# Bits per pixel of raw modes, for tiles that leave the row stride implicit
+RAW_BITS = {
+    '1': 1, '1;I': 1, '1;R': 1, 'L': 8, 'P': 8, 'I;16': 16, 'I;16B': 16,
+    'RGB': 24, 'BGR': 24, 'BGR;24': 24, 'RGBA': 32, 'RGBX': 32, 'BGRA': 32,
+    'BGRX': 32, 'CMYK': 32,
+}
+
+# Formats read in bands; others always take the normal path
+BANDED_FORMATS = (TiffImagePlugin.TiffImageFile, BmpImagePlugin.BmpImageFile,
+                  PpmImagePlugin.PpmImageFile)
+
+# (x0, x1, y0, y1, offset, rawmode, stride, orientation) of a raw tile
+RawTile = Tuple[int, int, int, int, int, str, int, int]
+
+
+def open_unchecked(path: str):
+    """Open an image in one of BANDED_FORMATS without Pillow's decompression
+    bomb check. Image.open applies the process-wide MAX_IMAGE_PIXELS, which
+    cannot be lifted for one call without affecting other threads; the
+    plugin classes do no such check, so callers check the size themselves
+    (see open_image)"""
+    for factory in BANDED_FORMATS:
+        try:
+            # The image opens the file and closes it with itself (or on failure)
+            return factory(path)
+        except SyntaxError:
+            continue
+    raise Image.UnidentifiedImageError(f"cannot identify image file '{path}'")
+
+
+def raw_row_tiles(img) -> Optional[List[RawTile]]:
+    """Row-addressable description of an unloaded image, or None if any
+    part of it is compressed or packed in a way decode_rows cannot read"""
+    if not isinstance(img, BANDED_FORMATS) or not img.tile or not getattr(img, 'filename', None):
+        return None
+
+    tiles = []
+    for codec, (x0, y0, x1, y1), offset, args in img.tile:
+        if codec != 'raw':
+            return None
+        if isinstance(args, str):
+            args = (args, 0, 1)
+        rawmode, stride, orientation = (tuple(args) + (0, 1))[:3]
+        # Also rules out planar TIFF, whose tiles each fill a single band
+        if rawmode not in RAW_BITS:
+            return None
+        if not stride:
+            stride = ((x1 - x0) * RAW_BITS[rawmode] + 7) // 8
+        tiles.append((x0, x1, y0, y1, offset, rawmode, stride, orientation))
+    return tiles
+
+
+def decode_rows(img, tiles: List[RawTile], top: int, bottom: int):
+    """Decode source rows top..bottom of img into an image of just those
+    rows, reading only their bytes from the file"""
+    size = (img.width, bottom - top)
+    strip = None
+    with open(img.filename, 'rb') as f:
+        for x0, x1, y0, y1, offset, rawmode, stride, orientation in tiles:
+            start, end = max(y0, top), min(y1, bottom)
+            if start >= end:
+                continue
+            if orientation < 0:
+                # Bottom-up storage (BMP): the last row of the range comes first
+                f.seek(offset + (y1 - end) * stride)
+            else:
+                f.seek(offset + (start - y0) * stride)
+            data = f.read((end - start) * stride)
+            if len(data) < (end - start) * stride:
+                raise OSError(f"image file is truncated: '{img.filename}'")
+            piece = Image.frombytes(img.mode, (x1 - x0, end - start), data,
+                                    'raw', rawmode, stride, orientation)
+            if piece.size == size:
+                # One tile spans the whole strip (BMP, PPM, single-strip TIFF)
+                strip = piece
+                continue
+            if strip is None:
+                strip = Image.new(img.mode, size)
+            strip.paste(piece, (x0, start - top))
+    if img.mode == 'P':
+        strip.putpalette(img.palette)
+    return strip
+
+
+def reduced_rows(img, tiles: List[RawTile], top: int, bottom: int,
+                 columns: int, mode: str):
+    """Source rows top..bottom shrunk to columns wide, decoded in strips of
+    at most MAX_BAND_PIXELS source pixels"""
+    strip_rows = max(1, MAX_BAND_PIXELS // img.width)
+    reduced = Image.new(mode, (columns, bottom - top))
+    for start in range(top, bottom, strip_rows):
+        end = min(start + strip_rows, bottom)
+        with decode_rows(img, tiles, start, end) as strip:
+            if strip.mode != mode:
+                strip = strip.convert(mode)
+            # Horizontal area average only; rows stay whole for the band pass
+            reduced.paste(strip.resize((columns, end - start), Image.Resampling.BOX),
+                          (0, start - top))
+    return reduced
+
+
+def tiled_bands(img, tiles: List[RawTile], width: int, mode: str, cell: tuple,
+                band_rows: int) -> Iterator:
+    """Area-averaged bands of the character grid (width columns, cell pixels
+    per character), decoded a bounded strip of source rows at a time"""
+    columns = width * cell[0]
+    # ASCII characters are roughly twice as tall as wide
+    rows = int(width * img.height / img.width * 0.5) * cell[1]
+    if rows <= 0:
+        return
+    # Source rows per grid row
+    scale = img.height / rows
+
+    # Grid rows per band: aligned, with the width-reduced source rows of a
+    # band within the pixel budget
+    per_band = max(1, int(MAX_BAND_PIXELS / (columns * scale)) // ROW_ALIGN) * ROW_ALIGN
+    per_band = min(per_band, band_rows * cell[1])
+
+    for first in range(0, rows, per_band):
+        last = min(first + per_band, rows)
+        y0, y1 = first * scale, last * scale
+        top, bottom = int(y0), min(img.height, math.ceil(y1))
+        band = reduced_rows(img, tiles, top, bottom, columns, mode)
+        # BOX with a fractional source box finishes the exact area average
+        yield band.resize((columns, last - first), Image.Resampling.BOX,
+                          box=(0, y0 - top, columns, y1 - top))
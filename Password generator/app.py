@@ -0,0 +1,259 @@
+"""
+Password Generator API - local HTTP service around PasswordGenerator
+====================================================================
+
+Single and batch generation (batches streamed as NDJSON) plus strength
+audits. Random bytes come from a pre-filled entropy pool so request
+latency does not include OS random reads.
+"""
+
+import json
+from flask import Flask, Response, request, jsonify, stream_with_context
+
+from password_engine import EntropyPool
+from password_gen import PasswordGenerator, DEFAULT_WORDLIST, default_wordlist
+from password_policy import PasswordPolicy
+
+
+app = Flask(__name__)
+
+# Limits for request parameters
+MAX_BATCH_COUNT = 1_000_000
+MIN_LENGTH, MAX_LENGTH = 8, 128
+MIN_WORDS, MAX_WORDS = 3, 20
+# Passwords generated per streamed chunk
+STREAM_CHUNK = 10_000
+
+MIN_FIELDS = ('min_lower', 'min_upper', 'min_digits', 'min_symbols')
+POLICY_FIELDS = MIN_FIELDS + ('max_repeats',)
+
+entropy_pool = EntropyPool()
+generator = PasswordGenerator(randbytes=entropy_pool)
+# Passphrase and pronounceable modes need a wordlist placed at DEFAULT_WORDLIST;
+# it and the Markov model are loaded once here, before any request thread runs
+wordlist_path = default_wordlist()
+if wordlist_path:
+    try:
+        generator.load_wordlist(wordlist_path)
+        generator.load_markov(wordlist_path)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not load {wordlist_path}: {e}")
+        wordlist_path = None
+
+
+def parse_int(data, key, default, low, high):
+    """Read an integer option and check its range"""
+    try:
+        value = int(data.get(key, default))
+    except (TypeError, ValueError):
+        raise ValueError(f"'{key}' must be an integer")
+    if not low <= value <= high:
+        raise ValueError(f"'{key}' must be between {low} and {high}")
+    return value
+
+
+def parse_bool(data, key, default):
+    """Read a boolean option from JSON or a query string"""
+    value = data.get(key, default)
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes', 'on')
+    return bool(value)
+
+
+def parse_policy(data, length):
+    """Build a PasswordPolicy from the optional 'policy' object, with its
+    limits checked against the password length (policies too large to
+    compile are refused by compile_policy)"""
+    policy_data = data.get('policy')
+    if not policy_data:
+        return None
+    if not isinstance(policy_data, dict):
+        raise ValueError("'policy' must be an object")
+
+    fields = {key: parse_int(policy_data, key, 0, 0, length)
+              for key in POLICY_FIELDS if key in policy_data}
+    if sum(fields.get(key, 0) for key in MIN_FIELDS) > length:
+        raise ValueError(f"Policy minimums add up to more than the length ({length})")
+    positions = policy_data.get('positions', [])
+    if not isinstance(positions, list) or len(positions) > length:
+        raise ValueError(f"'positions' must be a list of at most {length} entries")
+    try:
+        # Positions arrive as [[index, "classes"], ...]
+        positions = tuple((int(index), str(classes)) for index, classes in positions)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid policy: positions must be [index, classes] pairs")
+    return PasswordPolicy(forbidden=str(policy_data.get('forbidden', '')),
+                          positions=positions, **fields)
+
+
+def batch_function(data):
+    """Turn request options into a function producing n passwords"""
+    mode = data.get('mode', 'random')
+
+    if mode == 'random':
+        length = parse_int(data, 'length', 12, MIN_LENGTH, MAX_LENGTH)
+        options = {
+            'length': length,
+            'use_uppercase': parse_bool(data, 'uppercase', True),
+            'use_digits': parse_bool(data, 'digits', True),
+            'use_symbols': parse_bool(data, 'symbols', True),
+            'exclude_ambiguous': parse_bool(data, 'exclude_ambiguous', False),
+            'policy': parse_policy(data, length)
+        }
+        # Compile (and cache) the policy now so errors surface before streaming
+        if options['policy'] is not None:
+            generator.compile_policy(options['policy'], length, options['use_uppercase'],
+                                     options['use_digits'], options['use_symbols'],
+                                     options['exclude_ambiguous'])
+        return lambda n: generator.generate_batch(n, **options)
+
+    if mode == 'mask':
+        mask = data.get('mask')
+        if not mask or not isinstance(mask, str):
+            raise ValueError("'mask' is required in mask mode")
+        exclude_ambiguous = parse_bool(data, 'exclude_ambiguous', False)
+        generator.generate_from_mask(mask, 1, exclude_ambiguous)
+        return lambda n: generator.generate_from_mask(mask, n, exclude_ambiguous)
+
+    if mode in ('passphrase', 'pronounceable') and wordlist_path is None:
+        raise ValueError(f"Mode '{mode}' is unavailable: no wordlist at {DEFAULT_WORDLIST}")
+
+    if mode == 'passphrase':
+        words = parse_int(data, 'words', 6, MIN_WORDS, MAX_WORDS)
+        separator = str(data.get('separator', '-'))
+        capitalize = parse_bool(data, 'capitalize', False)
+        add_digit = parse_bool(data, 'add_digit', False)
+        return lambda n: generator.generate_passphrases(n, words, separator, capitalize, add_digit)
+
+    if mode == 'pronounceable':
+        length = parse_int(data, 'length', 12, MIN_LENGTH, MAX_LENGTH)
+        capitalize = parse_bool(data, 'capitalize', False)
+        digits = 1 if parse_bool(data, 'add_digit', False) else 0
+        return lambda n: generator.generate_pronounceable(n, length, capitalize, digits)
+
+    raise ValueError(f"Unknown mode '{mode}'")
+
+
+def request_options():
+    """Options from a JSON body, or from the query string for GET"""
+    if request.method == 'GET':
+        return request.args.to_dict()
+    return request.get_json(silent=True) or {}
+
+
+def strength_report(index, password):
+    strength, feedback = generator.check_strength(password)
+    return {'index': index, 'strength': strength, 'feedback': feedback}
+
+
+@app.route('/api/password', methods=['GET', 'POST'])
+def single_password():
+    """Generate one password"""
+    try:
+        make_batch = batch_function(request_options())
+        password = make_batch(1)[0]
+        strength, feedback = generator.check_strength(password)
+        return jsonify({
+            'success': True,
+            'password': password,
+            'strength': strength,
+            'feedback': feedback
+        })
+    except (OSError, ValueError) as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+
+@app.route('/api/passwords', methods=['POST'])
+def batch_passwords():
+    """Generate up to 10^6 passwords, streamed as NDJSON"""
+    try:
+        data = request_options()
+        count = parse_int(data, 'count', 1, 1, MAX_BATCH_COUNT)
+        make_batch = batch_function(data)
+    except (OSError, ValueError) as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+    def stream():
+        sent = 0
+        while sent < count:
+            batch = make_batch(min(STREAM_CHUNK, count - sent))
+            sent += len(batch)
+            yield ''.join('{"password": %s}\n' % json.dumps(p) for p in batch)
+
+    return Response(stream_with_context(stream()), mimetype='application/x-ndjson')
+
+
+@app.route('/api/strength', methods=['POST'])
+def strength_single():
+    """Audit the strength of one password"""
+    data = request.get_json(silent=True) or {}
+    password = data.get('password')
+    if not isinstance(password, str):
+        return jsonify({'success': False, 'error': "'password' is required"}), 400
+
+    report = strength_report(0, password)
+    return jsonify({'success': True, 'strength': report['strength'], 'feedback': report['feedback']})
+
+
+@app.route('/api/strength/batch', methods=['POST'])
+def strength_batch():
+    """Audit a list of passwords (JSON {"passwords": [...]} or one per line
+    as text/plain); results are streamed as NDJSON in input order"""
+    if request.is_json:
+        data = request.get_json(silent=True) or {}
+        passwords = data.get('passwords')
+        if not isinstance(passwords, list) or not all(isinstance(p, str) for p in passwords):
+            return jsonify({'success': False, 'error': "'passwords' must be a list of strings"}), 400
+    else:
+        passwords = request.get_data(as_text=True).splitlines()
+
+    if len(passwords) > MAX_BATCH_COUNT:
+        return jsonify({'success': False, 'error': f"At most {MAX_BATCH_COUNT} passwords per request"}), 400
+
+    def stream():
+        # Reports carry the input index rather than echoing the password
+        for start in range(0, len(passwords), STREAM_CHUNK):
+            chunk = passwords[start:start + STREAM_CHUNK]
+            yield ''.join(json.dumps(strength_report(start + i, p)) + '\n'
+                          for i, p in enumerate(chunk))
+
+    return Response(stream_with_context(stream()), mimetype='application/x-ndjson')
+
+
+@app.route('/health')
+def health():
+    """Health check endpoint"""
+    return jsonify({
+        'status': 'healthy',
+        'service': 'password-generator',
+        'entropy_pool_bytes': entropy_pool.available(),
+        'wordlist': wordlist_path
+    })
+
+
+@app.errorhandler(404)
+def not_found(error):
+    return jsonify({'error': 'Endpoint not found'}), 404
+
+
+@app.errorhandler(405)
+def method_not_allowed(error):
+    return jsonify({'error': 'Method not allowed'}), 405
+
+
+if __name__ == '__main__':
+    print("🔐 Starting Password Generator API...")
+    print("📡 Server: http://127.0.0.1:5050")
+    print("📚 API Endpoints:")
+    print("   GET/POST /api/password       - One password")
+    print("   POST     /api/passwords      - Batch (NDJSON stream, count <= 1,000,000)")
+    print("   POST     /api/strength       - Audit one password")
+    print("   POST     /api/strength/batch - Audit a list (NDJSON stream)")
+    print("   GET      /health             - Health check")
+    if wordlist_path:
+        print(f"📖 Passphrase mode uses {wordlist_path}")
+    else:
+        print(f"⚠️  Passphrase and pronounceable modes disabled: no wordlist at {DEFAULT_WORDLIST}")
+    print("⏹️  Press Ctrl+C to stop")
+
+    app.run(host='127.0.0.1', port=5050, threaded=True, use_reloader=False)
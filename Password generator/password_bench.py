@@ -0,0 +1,294 @@
+"""
+Benchmark and randomness quality suite for the password generator.
+Measures passwords/sec and bytes/sec for every mode and length, times
+check_strength and policy compilation (including large class minimums,
+which must compile quickly or be rejected), and runs chi-square uniformity tests over millions of
+samples. Results are printed (or saved) as JSON; the exit code is 1 if
+any uniformity test fails, so bias cannot slip in unnoticed.
+example usage: python password_bench.py --samples 2000000 -o bench.json
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import platform
+import argparse
+import tempfile
+from collections import Counter
+from itertools import product
+
+from password_engine import random_chars, random_indices
+from password_gen import PasswordGenerator
+from password_policy import PasswordPolicy, compile_policy
+
+
+LENGTHS = [8, 12, 16, 32, 64, 128]
+# Seconds spent measuring each throughput case
+DEFAULT_DURATION = 0.5
+DEFAULT_SAMPLES = 1_000_000
+# p-values below this are reported as failures
+DEFAULT_ALPHA = 1e-4
+# Small class charsets and policy whose compliant passwords can all be
+# enumerated (8 characters, length 4: 4096 candidates)
+ENUM_CLASSES = (('l', 'abc'), ('u', 'AB'), ('d', '01'), ('s', '!'))
+ENUM_LENGTH = 4
+ENUM_POLICY = PasswordPolicy(min_lower=1, min_upper=1, min_digits=1, max_repeats=1,
+                             positions=((0, 'lu'),))
+# (length, minimum per class, max repeats) of policies timed while compiling
+COMPILE_CASES = [(16, 1, 2), (64, 4, 3), (128, 4, 3), (128, 6, 0), (64, 8, 3), (128, 10, 3)]
+SYLLABLES = ["ka", "ro", "mi", "ten", "bal", "or", "ist", "ung", "pre",
+             "ver", "lo", "sa", "ne", "tor", "cha", "ble", "quin", "dra"]
+
+
+def chi_square_p_value(statistic, dof):
+    """Upper-tail p-value of a chi-square statistic (Wilson-Hilferty approximation)"""
+    if dof <= 0:
+        return 1.0
+    h = 2.0 / (9.0 * dof)
+    z = ((statistic / dof) ** (1.0 / 3.0) - (1.0 - h)) / math.sqrt(h)
+    return 0.5 * math.erfc(z / math.sqrt(2.0))
+
+
+def chi_square_uniform(counts, categories):
+    """Chi-square test of observed counts against a uniform distribution"""
+    total = sum(counts.get(c, 0) for c in categories)
+    expected = total / len(categories)
+    statistic = sum((counts.get(c, 0) - expected) ** 2 / expected for c in categories)
+    dof = len(categories) - 1
+    return {
+        'samples': total,
+        'categories': len(categories),
+        'chi_square': round(statistic, 3),
+        'dof': dof,
+        'p_value': chi_square_p_value(statistic, dof)
+    }
+
+
+def measure(make_batch, duration, batch_size=10_000):
+    """Run make_batch repeatedly for about duration seconds"""
+    produced = 0
+    output_bytes = 0
+    start = time.perf_counter()
+    while True:
+        batch = make_batch(batch_size)
+        produced += len(batch)
+        output_bytes += sum(len(p) for p in batch)
+        elapsed = time.perf_counter() - start
+        if elapsed >= duration:
+            break
+    return {
+        'passwords_per_sec': round(produced / elapsed, 1),
+        'bytes_per_sec': round(output_bytes / elapsed, 1),
+        'passwords': produced,
+        'seconds': round(elapsed, 3)
+    }
+
+
+def make_wordlist(directory, size=7776):
+    """Write a synthetic wordlist so passphrase modes can be measured anywhere"""
+    words = []
+    for i in range(size):
+        parts = []
+        n = i
+        for _ in range(4):
+            parts.append(SYLLABLES[n % len(SYLLABLES)])
+            n //= len(SYLLABLES)
+        words.append(''.join(parts))
+    path = os.path.join(directory, "bench_words.txt")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(words))
+    return path
+
+
+def throughput_cases(gen, wordlist_path):
+    """(name, parameters, batch function) for every mode and length"""
+    cases = []
+    for length in LENGTHS:
+        cases.append(('random', {'length': length},
+                      lambda n, length=length: gen.generate_batch(n, length)))
+        cases.append(('random_alnum', {'length': length},
+                      lambda n, length=length: gen.generate_batch(n, length, use_symbols=False)))
+        policy = PasswordPolicy(min_lower=1, min_upper=1, min_digits=1, min_symbols=1, max_repeats=2)
+        cases.append(('policy', {'length': length},
+                      lambda n, length=length, policy=policy: gen.generate_batch(n, length, policy=policy)))
+        if length >= 32:
+            policy = PasswordPolicy(min_lower=4, min_upper=4, min_digits=4, min_symbols=4, max_repeats=3)
+            cases.append(('policy_strict', {'length': length},
+                          lambda n, length=length, policy=policy: gen.generate_batch(n, length, policy=policy)))
+        cases.append(('pronounceable', {'length': length},
+                      lambda n, length=length: gen.generate_pronounceable(n, length, True, 1)))
+
+    for mask in ('Aaaa-9999-xxxx', 'XXXX-XXXX-XXXX-XXXX', '########'):
+        cases.append(('mask', {'mask': mask},
+                      lambda n, mask=mask: gen.generate_from_mask(mask, n)))
+
+    for words in (4, 6, 8):
+        cases.append(('passphrase', {'words': words, 'wordlist': os.path.basename(wordlist_path)},
+                      lambda n, words=words: gen.generate_passphrases(n, words)))
+
+    return cases
+
+
+def run_throughput(gen, wordlist_path, duration):
+    results = []
+    for name, params, make_batch in throughput_cases(gen, wordlist_path):
+        make_batch(10)  # warm caches (compiled policies and masks)
+        result = {'mode': name, **params, **measure(make_batch, duration)}
+        results.append(result)
+        print(f"⏱️ {name:<14} {json.dumps(params):<40} {result['passwords_per_sec']:>14,.0f} pw/s",
+              file=sys.stderr)
+    return results
+
+
+def run_policy_compile(gen):
+    """Time to compile policies with growing class minimums, or the reason
+    one is refused"""
+    results = []
+    for length, minimum, max_repeats in COMPILE_CASES:
+        policy = PasswordPolicy(min_lower=minimum, min_upper=minimum, min_digits=minimum,
+                                min_symbols=minimum, max_repeats=max_repeats)
+        params = {'length': length, 'minimum': minimum, 'max_repeats': max_repeats}
+        compile_policy.cache_clear()
+        start = time.perf_counter()
+        try:
+            gen.compile_policy(policy, length)
+            result = {**params, 'compile_ms': round((time.perf_counter() - start) * 1000, 1)}
+            shown = f"{result['compile_ms']:>10,.1f} ms"
+        except ValueError as e:
+            result = {**params, 'rejected': str(e),
+                      'reject_ms': round((time.perf_counter() - start) * 1000, 1)}
+            shown = "  rejected"
+        results.append(result)
+        print(f"⏱️ compile {json.dumps(params):<54} {shown}", file=sys.stderr)
+    compile_policy.cache_clear()
+    return results
+
+
+def run_strength_benchmark(gen, duration):
+    passwords = gen.generate_batch(10_000, 16)
+    checked = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration:
+        for password in passwords:
+            gen.check_strength(password)
+        checked += len(passwords)
+    elapsed = time.perf_counter() - start
+    return {'checks_per_sec': round(checked / elapsed, 1), 'checks': checked}
+
+
+def run_uniformity(gen, samples):
+    """Chi-square tests for characters, positions, masks, policies, words and indices"""
+    tests = []
+
+    def record(name, params, result):
+        tests.append({'test': name, **params, **result})
+
+    # Overall and per-position character distribution of the random mode
+    length = 16
+    count = max(1, samples // length)
+    charset = gen.build_charset()
+    text = ''.join(gen.generate_batch(count, length))
+    record('random_chars', {'length': length}, chi_square_uniform(Counter(text), charset))
+    for pos in (0, length // 2, length - 1):
+        record('random_position', {'length': length, 'position': pos},
+               chi_square_uniform(Counter(text[pos::length]), charset))
+
+    ambiguous_free = gen.build_charset(exclude_ambiguous=True)
+    text = random_chars(samples, ambiguous_free, gen.randbytes)
+    record('exclude_ambiguous_chars', {}, chi_square_uniform(Counter(text), ambiguous_free))
+
+    # Every class position of a mask
+    mask = 'Aa9x'
+    passwords = gen.generate_from_mask(mask, samples // len(mask))
+    tokens = dict(gen.mask_tokens())
+    for pos, token in enumerate(mask):
+        column = Counter(p[pos] for p in passwords)
+        record('mask_position', {'mask': mask, 'position': pos},
+               chi_square_uniform(column, tokens[token]))
+
+    # Raw index draws at awkward range sizes (rejection sampling edges)
+    for n in (3, 100, 7776, 70_000):
+        draws = random_indices(samples, n, gen.randbytes)
+        record('random_indices', {'n': n}, chi_square_uniform(Counter(draws), range(n)))
+
+    # Policy mode over a space small enough to enumerate: the compiled count
+    # must be exact, and every compliant password equally likely
+    compiled = compile_policy(ENUM_POLICY, ENUM_LENGTH, ENUM_CLASSES)
+    alphabet = ''.join(charset for _, charset in ENUM_CLASSES)
+    compliant = [p for p in map(''.join, product(alphabet, repeat=ENUM_LENGTH))
+                 if ENUM_POLICY.allows(p, ENUM_CLASSES)]
+    drawn = Counter(compiled.sample(samples, gen.randbytes))
+    result = chi_square_uniform(drawn, compliant)
+    result['exact_count'] = compiled.total
+    result['enumerated'] = len(compliant)
+    result['invalid_samples'] = samples - result['samples']
+    result['exact'] = compiled.total == len(compliant) and not result['invalid_samples']
+    record('policy_passwords', {'length': ENUM_LENGTH}, result)
+
+    # Words chosen by passphrase mode
+    words_per = 6
+    phrases = gen.generate_passphrases(max(1, samples // words_per), words_per, separator=' ')
+    word_counts = Counter(w for phrase in phrases for w in phrase.split(' '))
+    wordlist = gen.wordlist.words(range(len(gen.wordlist)))
+    record('passphrase_words', {'words': words_per}, chi_square_uniform(word_counts, wordlist))
+
+    return tests
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark and test the password generator")
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES,
+                        help=f"Samples per uniformity test (default: {DEFAULT_SAMPLES:,})")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION,
+                        help=f"Seconds per throughput case (default: {DEFAULT_DURATION})")
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA,
+                        help=f"Fail uniformity tests with p below this (default: {DEFAULT_ALPHA})")
+    parser.add_argument("--skip-throughput", action="store_true",
+                        help="Only run the uniformity tests")
+    parser.add_argument("-o", "--output", help="Write JSON results to a file")
+    args = parser.parse_args()
+
+    gen = PasswordGenerator()
+    with tempfile.TemporaryDirectory() as tmp:
+        wordlist_path = make_wordlist(tmp)
+        gen.load_wordlist(wordlist_path)
+        gen.load_markov(wordlist_path)
+
+        report = {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'samples': args.samples,
+            'alpha': args.alpha
+        }
+        if not args.skip_throughput:
+            report['throughput'] = run_throughput(gen, wordlist_path, args.duration)
+            report['check_strength'] = run_strength_benchmark(gen, args.duration)
+            report['policy_compile'] = run_policy_compile(gen)
+
+        report['uniformity'] = run_uniformity(gen, args.samples)
+        gen.wordlist.close()
+
+    # Tests that also check an exact count fail on a mismatch whatever the p-value
+    failures = [t for t in report['uniformity']
+                if t['p_value'] < args.alpha or not t.get('exact', True)]
+    report['passed'] = not failures
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+        print(f"💾 Results saved to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+    if failures:
+        for t in failures:
+            print(f"❌ Non-uniform: {t['test']} (p={t['p_value']:.2e})", file=sys.stderr)
+        sys.exit(1)
+    print("✅ All uniformity tests passed", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
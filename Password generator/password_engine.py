@@ -0,0 +1,177 @@
+"""
+Bulk randomness engine shared by all password generator modes.
+Draws random bytes from the OS in large blocks and turns them into
+uniform characters or indices without per-item Python calls.
+"""
+
+import os
+import threading
+from array import array
+from functools import lru_cache
+from typing import Callable, List
+
+
+RandBytes = Callable[[int], bytes]
+
+# Typecodes for unsigned array items of 2, 4 and 8 bytes
+_WIDE_TYPECODES = {
+    array(code).itemsize: code for code in ('H', 'I', 'L', 'Q')
+}
+
+
+@lru_cache(maxsize=64)
+def _byte_tables(charset: str):
+    """Build translate/delete tables mapping random bytes onto a charset"""
+    n = len(charset)
+    # Bytes at or above limit would bias the modulo, so they are dropped
+    limit = 256 - 256 % n
+    table = bytes(ord(charset[b % n]) for b in range(256))
+    delete = bytes(range(limit, 256))
+    return table, delete, limit
+
+
+def random_chars(count: int, charset: str, randbytes: RandBytes = os.urandom) -> str:
+    """Return count characters drawn uniformly from an ASCII charset"""
+    if not charset:
+        raise ValueError("No character types selected")
+    if count <= 0:
+        return ""
+    if len(charset) == 1:
+        return charset * count
+    if len(charset) > 256 or not charset.isascii():
+        return ''.join(charset[i] for i in random_indices(count, len(charset), randbytes))
+
+    table, delete, limit = _byte_tables(charset)
+    chunks = []
+    have = 0
+    while have < count:
+        need = count - have
+        # Oversample slightly so one draw is almost always enough
+        raw = randbytes(need * 256 // limit + 32)
+        chunk = raw.translate(table, delete)
+        chunks.append(chunk)
+        have += len(chunk)
+
+    return b''.join(chunks)[:count].decode('ascii')
+
+
+def bytes_needed(count: int, charset: str) -> int:
+    """Random bytes random_chars asks for on its first draw"""
+    if count <= 0 or len(charset) <= 1 or len(charset) > 256 or not charset.isascii():
+        return 0
+    _, _, limit = _byte_tables(charset)
+    return count * 256 // limit + 32
+
+
+def prefetched(size: int, randbytes: RandBytes = os.urandom) -> RandBytes:
+    """Serve reads from one pre-drawn block, falling back when it runs out"""
+    block = randbytes(size)
+    pos = 0
+
+    def read(n: int) -> bytes:
+        nonlocal pos
+        chunk = block[pos:pos + n]
+        pos += len(chunk)
+        if len(chunk) < n:
+            chunk += randbytes(n - len(chunk))
+        return chunk
+
+    return read
+
+
+class EntropyPool:
+    """Pre-filled buffer of OS random bytes, topped up by a background thread"""
+
+    def __init__(self, size: int = 4 * 1024 * 1024, source: RandBytes = os.urandom):
+        self.size = size
+        self.source = source
+        self._buffer = bytearray(source(size))
+        self._pos = 0
+        self._lock = threading.Lock()
+        self._refill_needed = threading.Event()
+
+        self._thread = threading.Thread(target=self._refill_loop, daemon=True)
+        self._thread.start()
+
+    def available(self) -> int:
+        with self._lock:
+            return len(self._buffer) - self._pos
+
+    def read(self, n: int) -> bytes:
+        """Take n bytes from the pool, reading the OS directly for any shortfall"""
+        with self._lock:
+            end = min(self._pos + n, len(self._buffer))
+            chunk = bytes(self._buffer[self._pos:end])
+            self._pos = end
+            if len(self._buffer) - self._pos < self.size // 2:
+                self._refill_needed.set()
+
+        if len(chunk) < n:
+            chunk += self.source(n - len(chunk))
+        return chunk
+
+    # Lets a pool be passed anywhere a randbytes callable is expected
+    __call__ = read
+
+    def _refill_loop(self):
+        while True:
+            self._refill_needed.wait()
+            # Read outside the lock so callers are never blocked on the syscall
+            fresh = self.source(self.size)
+            with self._lock:
+                self._buffer = self._buffer[self._pos:] + fresh
+                self._pos = 0
+                self._refill_needed.clear()
+
+
+def random_indices(count: int, n: int, randbytes: RandBytes = os.urandom) -> List[int]:
+    """Return count integers drawn uniformly from range(n)"""
+    if n <= 0:
+        raise ValueError("Cannot draw from an empty range")
+    if count <= 0:
+        return []
+    if n == 1:
+        return [0] * count
+
+    # Smallest item width (in bytes) that covers the range
+    width = 1
+    while 256 ** width < n:
+        width *= 2
+    if width > 8:
+        return _random_big_indices(count, n, randbytes)
+
+    space = 256 ** width
+    limit = space - space % n
+    result = []
+    while len(result) < count:
+        need = count - len(result)
+        raw = randbytes((need * space // limit + 8) * width)
+        if width == 1:
+            values = raw
+        else:
+            values = array(_WIDE_TYPECODES[width])
+            values.frombytes(raw)
+        result.extend(v % n for v in values if v < limit)
+
+    del result[count:]
+    return result
+
+
+def _random_big_indices(count: int, n: int, randbytes: RandBytes) -> List[int]:
+    """Draw uniform integers too wide for an array typecode"""
+    nbits = (n - 1).bit_length()
+    nbytes = (nbits + 7) // 8
+    mask = (1 << nbits) - 1
+    from_bytes = int.from_bytes
+    result = []
+    while len(result) < count:
+        # Masking to nbits keeps the rejection rate below one half
+        need = count - len(result)
+        raw = randbytes(2 * need * nbytes)
+        for i in range(0, len(raw), nbytes):
+            value = from_bytes(raw[i:i + nbytes], 'little') & mask
+            if value < n:
+                result.append(value)
+
+    del result[count:]
+    return result
@@ -5,40 +5,203 @@ To see the commands and usage, run "python password_gen.py --help"
 example usage: python password_gen.py -l 16 -c 3.
 """
 
-import random
+import os
+import math
 import string
 import argparse
 import sys
+import time
+import threading
+from typing import List, Optional
+
+from password_engine import random_chars, random_indices
+from password_markov import load_model
+from password_mask import compile_mask
+from password_policy import PasswordPolicy, compile_policy
+from password_unique import FingerprintSet, unique_batches
+from password_wordlist import load_wordlist
+
+
+# Optional wordlist location for passphrase and pronounceable modes; no
+# wordlist ships with the generator, so one must be placed here or given
+DEFAULT_WORDLIST = os.path.join(os.path.dirname(os.path.abspath(__file__)), "wordlist.txt")
+NO_WORDLIST = ("No wordlist available: pass one with --wordlist FILE "
+               f"or place it at {DEFAULT_WORDLIST}")
+
+
+def default_wordlist() -> Optional[str]:
+    """DEFAULT_WORDLIST if a wordlist has been placed there"""
+    return DEFAULT_WORDLIST if os.path.exists(DEFAULT_WORDLIST) else None
+
+# Passwords generated per chunk when writing large batches to a file
+BATCH_SIZE = 100_000
+# Upper limit for --count when writing to a file
+MAX_FILE_COUNT = 100_000_000
 
 
 class PasswordGenerator:
-    def __init__(self):
+    def __init__(self, randbytes=os.urandom):
         self.lowercase = string.ascii_lowercase
         self.uppercase = string.ascii_uppercase
         self.digits = string.digits
         self.symbols = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+        self.ambiguous = "0O1l|"
+        # Source of random bytes for every generation mode
+        self.randbytes = randbytes
+        self.wordlist = None
+        self.markov = None
+        # Serializes lazy loads when one generator serves several threads
+        self._load_lock = threading.Lock()
     
-    def generate(self, length=12, use_uppercase=True, use_digits=True, 
-                 use_symbols=True, exclude_ambiguous=False):
-        """Generate password with given parameters"""
-        charset = self.lowercase
+    def class_charsets(self, use_uppercase=True, use_digits=True,
+                       use_symbols=True, exclude_ambiguous=False):
+        """(class key, characters) pairs for the selected options"""
+        classes = [('l', self.lowercase)]
         
         if use_uppercase:
-            charset += self.uppercase
+            classes.append(('u', self.uppercase))
         if use_digits:
-            charset += self.digits
+            classes.append(('d', self.digits))
         if use_symbols:
-            charset += self.symbols
+            classes.append(('s', self.symbols))
         
         if exclude_ambiguous:
-            ambiguous = "0O1l|"
-            charset = ''.join(c for c in charset if c not in ambiguous)
+            classes = [(key, ''.join(c for c in chars if c not in self.ambiguous))
+                       for key, chars in classes]
+        
+        return tuple((key, chars) for key, chars in classes if chars)
+    
+    def build_charset(self, use_uppercase=True, use_digits=True,
+                      use_symbols=True, exclude_ambiguous=False):
+        """Build the character pool for the selected options"""
+        classes = self.class_charsets(use_uppercase, use_digits, use_symbols, exclude_ambiguous)
+        charset = ''.join(chars for _, chars in classes)
         
         if not charset:
             raise ValueError("No character types selected")
         
-        password = ''.join(random.choice(charset) for _ in range(length))
-        return password
+        return charset
+    
+    def generate(self, length=12, use_uppercase=True, use_digits=True, 
+                 use_symbols=True, exclude_ambiguous=False, policy=None):
+        """Generate password with given parameters"""
+        return self.generate_batch(1, length, use_uppercase, use_digits,
+                                   use_symbols, exclude_ambiguous, policy)[0]
+    
+    def generate_batch(self, count, length=12, use_uppercase=True, use_digits=True,
+                       use_symbols=True, exclude_ambiguous=False, policy=None) -> List[str]:
+        """Generate many passwords from a single block of random characters"""
+        if policy is not None:
+            compiled = self.compile_policy(policy, length, use_uppercase, use_digits,
+                                           use_symbols, exclude_ambiguous)
+            return compiled.sample(count, self.randbytes)
+        
+        charset = self.build_charset(use_uppercase, use_digits, use_symbols, exclude_ambiguous)
+        chars = random_chars(count * length, charset, self.randbytes)
+        return [chars[i:i + length] for i in range(0, count * length, length)]
+    
+    def compile_policy(self, policy, length=12, use_uppercase=True, use_digits=True,
+                       use_symbols=True, exclude_ambiguous=False):
+        """Compile (or fetch the cached) policy tables for these options"""
+        classes = self.class_charsets(use_uppercase, use_digits, use_symbols, exclude_ambiguous)
+        return compile_policy(policy, length, classes)
+    
+    def mask_tokens(self):
+        """Mask token characters and the charsets they stand for"""
+        letters = self.lowercase + self.uppercase
+        return (
+            ('a', self.lowercase),
+            ('A', self.uppercase),
+            ('9', self.digits),
+            ('#', letters + self.digits),
+            ('x', self.digits + 'abcdef'),
+            ('X', self.digits + 'ABCDEF'),
+            ('$', self.symbols),
+            ('*', letters + self.digits + self.symbols),
+        )
+    
+    def generate_from_mask(self, mask, count=1, exclude_ambiguous=False) -> List[str]:
+        """Generate passwords following a mask such as Aaaa-9999-xxxx"""
+        compiled = compile_mask(mask, self.mask_tokens(), exclude_ambiguous, self.ambiguous)
+        return compiled.generate(count, self.randbytes)
+    
+    def load_wordlist(self, path=None):
+        """Load (and compile if needed) the wordlist used for passphrases"""
+        path = path or default_wordlist()
+        if path is None:
+            raise FileNotFoundError(NO_WORDLIST)
+        # The previous list is not closed here: another thread may still be
+        # reading it, and its mapping is released once nothing refers to it
+        self.wordlist = load_wordlist(path)
+        return self.wordlist
+    
+    def _require_wordlist(self):
+        if self.wordlist is None:
+            with self._load_lock:
+                if self.wordlist is None:
+                    self.load_wordlist()
+        return self.wordlist
+    
+    def generate_passphrase(self, word_count=6, separator="-", capitalize=False,
+                            add_digit=False):
+        """Generate a diceware-style passphrase"""
+        return self.generate_passphrases(1, word_count, separator, capitalize, add_digit)[0]
+    
+    def generate_passphrases(self, count, word_count=6, separator="-",
+                             capitalize=False, add_digit=False) -> List[str]:
+        """Generate many passphrases, drawing all word indices in one block"""
+        wordlist = self._require_wordlist()
+        if word_count < 1:
+            raise ValueError("Passphrase needs at least one word")
+        
+        indices = random_indices(count * word_count, len(wordlist), self.randbytes)
+        words = wordlist.words(indices)
+        if capitalize:
+            words = [w.capitalize() for w in words]
+        
+        if add_digit:
+            # Append one random digit to one random word of each passphrase
+            targets = random_indices(count, word_count, self.randbytes)
+            digits = random_chars(count, self.digits, self.randbytes)
+            for i in range(count):
+                pos = i * word_count + targets[i]
+                words[pos] += digits[i]
+        
+        return [separator.join(words[i:i + word_count])
+                for i in range(0, count * word_count, word_count)]
+    
+    def passphrase_entropy(self, word_count=6, add_digit=False) -> float:
+        """Entropy in bits of a passphrase from the loaded wordlist"""
+        bits = word_count * math.log2(len(self._require_wordlist()))
+        if add_digit:
+            bits += math.log2(10 * word_count)
+        return bits
+    
+    def load_markov(self, path=None):
+        """Load a Markov model, training it from a wordlist if needed"""
+        path = path or default_wordlist()
+        if path is None:
+            raise FileNotFoundError(NO_WORDLIST)
+        self.markov = load_model(path)
+        return self.markov
+    
+    def generate_pronounceable(self, count=1, length=12, capitalize=False,
+                               digits=0) -> List[str]:
+        """Generate memorable passwords from the letter Markov model"""
+        if self.markov is None:
+            with self._load_lock:
+                if self.markov is None:
+                    self.load_markov()
+        if not 0 <= digits < length:
+            raise ValueError("Digits must leave room for at least one letter")
+        
+        letters = self.markov.generate(count, length - digits, capitalize, self.randbytes)
+        if not digits:
+            return letters
+        
+        suffixes = random_chars(count * digits, self.digits, self.randbytes)
+        return [word + suffixes[i * digits:(i + 1) * digits]
+                for i, word in enumerate(letters)]
     
     def check_strength(self, password):
         """Basic password strength check"""
@@ -130,6 +293,21 @@ def interactive_mode():
             break
 
 
+def write_passwords(filename, make_batch, count):
+    """Write count passwords to a file, one per line, in fixed-size chunks"""
+    written = 0
+    with open(filename, 'w', encoding='utf-8') as f:
+        while written < count:
+            batch = make_batch(min(BATCH_SIZE, count - written))
+            if not batch:
+                # The batch source was cancelled
+                break
+            f.write('\n'.join(batch))
+            f.write('\n')
+            written += len(batch)
+    return written
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate secure passwords")
     parser.add_argument("-l", "--length", type=int, default=12, 
@@ -144,9 +322,61 @@ def main():
                        help="Exclude symbols")
     parser.add_argument("--exclude-ambiguous", action="store_true",
                        help="Exclude ambiguous characters (0,O,1,l)")
+    parser.add_argument("-m", "--mask",
+                       help="Generate from a mask, e.g. 'Aaaa-9999-xxxx' (see password_mask.py)")
+    parser.add_argument("-o", "--output",
+                       help="Write passwords to a file, one per line (allows large counts)")
+    parser.add_argument("-u", "--unique", action="store_true",
+                       help="Never output the same password twice")
+    parser.add_argument("--unique-store",
+                       help="File that remembers issued passwords between runs (implies --unique)")
     parser.add_argument("-i", "--interactive", action="store_true",
                        help="Interactive mode")
     
+    policy_group = parser.add_argument_group("policy")
+    policy_group.add_argument("--min-lower", type=int, default=0,
+                              help="Minimum lowercase letters")
+    policy_group.add_argument("--min-upper", type=int, default=0,
+                              help="Minimum uppercase letters")
+    policy_group.add_argument("--min-digits", type=int, default=0,
+                              help="Minimum numbers")
+    policy_group.add_argument("--min-symbols", type=int, default=0,
+                              help="Minimum symbols")
+    policy_group.add_argument("--forbid", default="",
+                              help="Characters that must never appear")
+    policy_group.add_argument("--max-repeats", type=int, default=0,
+                              help="Longest run of one repeated character (default: unlimited)")
+    
+    passphrase_group = parser.add_argument_group("passphrase and pronounceable modes")
+    passphrase_group.add_argument("--passphrase", action="store_true",
+                                  help="Generate diceware-style passphrases")
+    passphrase_group.add_argument("--pronounceable", action="store_true",
+                                  help="Generate memorable passwords from a letter Markov model")
+    passphrase_group.add_argument("--wordlist", default=default_wordlist(),
+                                  help="Wordlist file, text or compiled; required unless "
+                                       "wordlist.txt is placed next to this script")
+    passphrase_group.add_argument("--model",
+                                  help="Markov model file for --pronounceable "
+                                       "(default: trained from --wordlist)")
+    passphrase_group.add_argument("-w", "--words", type=int, default=6,
+                                  help="Words per passphrase (default: 6)")
+    passphrase_group.add_argument("--separator", default="-",
+                                  help="Separator between words (default: -)")
+    passphrase_group.add_argument("--capitalize", action="store_true",
+                                  help="Capitalize each word")
+    passphrase_group.add_argument("--add-digit", action="store_true",
+                                  help="Append a random digit to one word "
+                                       "(end of the password in pronounceable mode)")
+    
+    provision_group = parser.add_argument_group("provisioning")
+    provision_group.add_argument("--provision", metavar="USERS_FILE",
+                                 help="Create a password and bcrypt hash for every username "
+                                      "in USERS_FILE (one per line); requires --output")
+    provision_group.add_argument("--cost", type=int, default=12,
+                                 help="bcrypt cost factor (default: 12)")
+    provision_group.add_argument("--workers", type=int, default=None,
+                                 help="Hashing processes (default: CPU count)")
+    
     args = parser.parse_args()
     
     print_banner()
@@ -156,40 +386,131 @@ def main():
         return
     
     # Validate arguments
-    if not 8 <= args.length <= 128:
+    if args.passphrase:
+        if not 3 <= args.words <= 20:
+            print("❌ Word count must be between 3 and 20")
+            sys.exit(1)
+    elif args.mask is not None:
+        if not args.mask:
+            print("❌ Mask cannot be empty")
+            sys.exit(1)
+    elif not 8 <= args.length <= 128:
         print("❌ Length must be between 8 and 128")
         sys.exit(1)
     
-    if not 1 <= args.count <= 10:
-        print("❌ Count must be between 1 and 10")
+    if args.passphrase and not args.wordlist:
+        print(f"❌ --passphrase needs a wordlist. {NO_WORDLIST}")
+        sys.exit(1)
+    if args.pronounceable and not (args.model or args.wordlist):
+        print(f"❌ --pronounceable needs a wordlist or --model. {NO_WORDLIST}")
+        sys.exit(1)
+    
+    if args.provision and not args.output:
+        print("❌ --provision requires --output")
+        sys.exit(1)
+    if args.provision and not 4 <= args.cost <= 31:
+        print("❌ bcrypt cost must be between 4 and 31")
+        sys.exit(1)
+    
+    max_count = MAX_FILE_COUNT if args.output else 10
+    if not args.provision and not 1 <= args.count <= max_count:
+        print(f"❌ Count must be between 1 and {max_count}")
         sys.exit(1)
     
     gen = PasswordGenerator()
     
+    policy = None
+    if (args.min_lower or args.min_upper or args.min_digits or args.min_symbols
+            or args.forbid or args.max_repeats):
+        policy = PasswordPolicy(
+            min_lower=args.min_lower,
+            min_upper=args.min_upper,
+            min_digits=args.min_digits,
+            min_symbols=args.min_symbols,
+            forbidden=args.forbid,
+            max_repeats=args.max_repeats
+        )
+    
+    try:
+        if args.passphrase:
+            gen.load_wordlist(args.wordlist)
+            
+            def make_batch(n):
+                return gen.generate_passphrases(n, args.words, args.separator,
+                                                args.capitalize, args.add_digit)
+        elif args.pronounceable:
+            gen.load_markov(args.model or args.wordlist)
+            
+            def make_batch(n):
+                return gen.generate_pronounceable(n, args.length, args.capitalize,
+                                                  1 if args.add_digit else 0)
+        elif args.mask is not None:
+            def make_batch(n):
+                return gen.generate_from_mask(args.mask, n, args.exclude_ambiguous)
+        else:
+            def make_batch(n):
+                return gen.generate_batch(
+                    n,
+                    length=args.length,
+                    use_uppercase=not args.no_upper,
+                    use_digits=not args.no_digits,
+                    use_symbols=not args.no_symbols,
+                    exclude_ambiguous=args.exclude_ambiguous,
+                    policy=policy
+                )
+        
+        seen = None
+        if args.unique or args.unique_store:
+            if args.unique_store:
+                seen = FingerprintSet.open(args.unique_store, args.count)
+            else:
+                seen = FingerprintSet(args.count)
+            make_batch = unique_batches(make_batch, seen)
+        
+        if args.provision:
+            from password_provision import provision, read_usernames, write_rows
+            
+            usernames = read_usernames(args.provision)
+            start = time.perf_counter()
+            rows = provision(usernames, make_batch, args.cost, args.workers)
+            written = write_rows(rows, args.output)
+            elapsed = time.perf_counter() - start
+            rate = written / elapsed if elapsed > 0 else float('inf')
+            print(f"💾 Provisioned {written} accounts to {args.output} ({rate:,.1f} hashes/s)")
+        elif args.output:
+            start = time.perf_counter()
+            written = write_passwords(args.output, make_batch, args.count)
+            elapsed = time.perf_counter() - start
+            rate = written / elapsed if elapsed > 0 else float('inf')
+            print(f"💾 Wrote {written} passwords to {args.output} ({rate:,.0f}/s)")
+        else:
+            passwords = make_batch(args.count)
+        
+        if args.unique_store:
+            seen.save(args.unique_store)
+            print(f"🗂️ {len(seen)} issued passwords remembered in {args.unique_store}")
+        
+        if args.output:
+            return
+        
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    
     print(f"\n🔐 Generated Password{'s' if args.count > 1 else ''}:")
     print("-" * 50)
     
-    for i in range(args.count):
-        try:
-            password = gen.generate(
-                length=args.length,
-                use_uppercase=not args.no_upper,
-                use_digits=not args.no_digits,
-                use_symbols=not args.no_symbols,
-                exclude_ambiguous=args.exclude_ambiguous
-            )
-            
+    for i, password in enumerate(passwords):
+        print(f"{i+1}. {password}")
+        if args.passphrase:
+            bits = gen.passphrase_entropy(args.words, args.add_digit)
+            print(f"   Entropy: {bits:.1f} bits")
+        else:
             strength, feedback = gen.check_strength(password)
-            
-            print(f"{i+1}. {password}")
             print(f"   Strength: {strength}")
             if feedback:
                 print(f"   Suggestions: {', '.join(feedback)}")
-            print()
-            
-        except ValueError as e:
-            print(f"❌ Error: {e}")
-            sys.exit(1)
+        print()
 
 
 if __name__ == "__main__":
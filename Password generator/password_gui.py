@@ -1,9 +1,85 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
-import random
-import string
+from tkinter import ttk, messagebox, filedialog
+import queue
+import threading
 import pyperclip
 
+from password_gen import PasswordGenerator, MAX_FILE_COUNT, write_passwords
+
+
+# Largest batch kept in memory for the on-screen list
+MAX_DISPLAY_COUNT = 1_000_000
+# Passwords produced per worker step before handing results to the UI
+CHUNK_SIZE = 10_000
+# How often (ms) the UI checks the worker queue
+POLL_INTERVAL = 50
+
+
+class VirtualListView:
+    """Read-only list that only renders the lines currently visible"""
+    
+    def __init__(self, parent, format_line, **text_options):
+        self.items = []
+        self.top = 0
+        # Callable turning (index, item) into one display line
+        self.format_line = format_line
+        
+        self.text = tk.Text(parent, wrap="none", state="disabled", **text_options)
+        self.scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self.yview)
+        
+        self.text.bind("<Configure>", lambda e: self.render())
+        self.text.bind("<MouseWheel>", self._on_wheel)
+        self.text.bind("<Button-4>", lambda e: self.scroll(-3))
+        self.text.bind("<Button-5>", lambda e: self.scroll(3))
+    
+    def visible_rows(self):
+        line_height = max(1, self.text.tk.call("font", "metrics", self.text.cget("font"), "-linespace"))
+        return max(1, self.text.winfo_height() // line_height)
+    
+    def set_items(self, items):
+        self.items = items
+        self.top = 0
+        self.render()
+    
+    def items_added(self):
+        """Refresh after items were appended to the shared list"""
+        self.render()
+    
+    def scroll(self, lines):
+        self.top += lines
+        self.render()
+    
+    def yview(self, *args):
+        # Scrollbar callback: ("moveto", fraction) or ("scroll", n, "units"/"pages")
+        rows = self.visible_rows()
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * len(self.items))
+        elif args[0] == "scroll":
+            step = rows if args[2] == "pages" else 1
+            self.top += int(args[1]) * step
+        self.render()
+    
+    def _on_wheel(self, event):
+        self.scroll(-3 if event.delta > 0 else 3)
+    
+    def render(self):
+        rows = self.visible_rows()
+        total = len(self.items)
+        self.top = max(0, min(self.top, total - rows))
+        
+        lines = [self.format_line(i, self.items[i])
+                 for i in range(self.top, min(self.top + rows, total))]
+        
+        self.text.config(state="normal")
+        self.text.delete(1.0, tk.END)
+        self.text.insert(tk.END, "\n".join(lines))
+        self.text.config(state="disabled")
+        
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
 
 class PasswordGeneratorGUI:
     
@@ -12,11 +88,15 @@ class PasswordGeneratorGUI:
         self.window = tk.Tk()
         self.setup_window()
         
-        # Define character sets for password generation
-        self.lowercase = string.ascii_lowercase
-        self.uppercase = string.ascii_uppercase
-        self.digits = string.digits
-        self.symbols = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+        # Shared password engine
+        self.generator = PasswordGenerator()
+        
+        # Background worker state
+        self.generated_passwords = []
+        self.results = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.worker = None
+        self.exported_count = 0
         
         # Initialize GUI components
         self.create_widgets()
@@ -140,21 +220,29 @@ class PasswordGeneratorGUI:
         count_spinbox = ttk.Spinbox(
             controls_frame,
             from_=1,
-            to=10,
-            width=5,
+            to=MAX_FILE_COUNT,
+            width=10,
             textvariable=self.count_var
         )
         count_spinbox.pack(side="left", padx=(10, 5))
         
         ttk.Label(controls_frame, text="passwords").pack(side="left")
         
-        generate_btn = ttk.Button(
+        self.generate_btn = ttk.Button(
             controls_frame,
             text="🔐 Generate",
             command=self.generate_passwords,
             style="Accent.TButton"
         )
-        generate_btn.pack(side="right", padx=(20, 0))
+        self.generate_btn.pack(side="right", padx=(20, 0))
+        
+        self.stop_btn = ttk.Button(
+            controls_frame,
+            text="⏹️ Stop",
+            command=self.stop_generation,
+            state="disabled"
+        )
+        self.stop_btn.pack(side="right", padx=(10, 0))
         
         clear_btn = ttk.Button(
             controls_frame,
@@ -167,22 +255,16 @@ class PasswordGeneratorGUI:
         display_frame = ttk.LabelFrame(parent, text="Generated Passwords", padding="15")
         display_frame.grid(row=3, column=0, columnspan=2, sticky="nsew")
         
-        # Text widget for displaying generated passwords
-        self.passwords_text = tk.Text(
+        # Virtualized list: only the visible lines are ever rendered
+        self.password_list = VirtualListView(
             display_frame,
+            self.format_password_line,
             height=12,
             width=60,
-            font=("Consolas", 11),
-            wrap="word",
-            state="disabled"  # Read-only by default
+            font=("Consolas", 11)
         )
-        
-        # Scrollbar for long password lists
-        scrollbar = ttk.Scrollbar(display_frame, orient="vertical", command=self.passwords_text.yview)
-        self.passwords_text.configure(yscrollcommand=scrollbar.set)
-        
-        self.passwords_text.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.password_list.text.grid(row=0, column=0, sticky="nsew")
+        self.password_list.scrollbar.grid(row=0, column=1, sticky="ns")
         
         buttons_frame = ttk.Frame(display_frame)
         buttons_frame.grid(row=1, column=0, columnspan=2, pady=(10, 0), sticky="ew")
@@ -201,6 +283,17 @@ class PasswordGeneratorGUI:
         )
         copy_last_btn.pack(side="left", padx=(10, 0))
         
+        self.export_btn = ttk.Button(
+            buttons_frame,
+            text="💾 Export to File",
+            command=self.export_passwords
+        )
+        self.export_btn.pack(side="left", padx=(10, 0))
+        
+        # Progress of the background worker
+        self.status_label = ttk.Label(buttons_frame, text="")
+        self.status_label.pack(side="right")
+        
         display_frame.columnconfigure(0, weight=1)
         display_frame.rowconfigure(0, weight=1)
         
@@ -210,114 +303,161 @@ class PasswordGeneratorGUI:
     def update_length_label(self, value):
         self.length_label.config(text=str(int(float(value))))
     
-    def generate_password(self, length, use_uppercase, use_digits, use_symbols, exclude_ambiguous):
-        charset = self.lowercase
-        
-        if use_uppercase:
-            charset += self.uppercase
-        if use_digits:
-            charset += self.digits
-        if use_symbols:
-            charset += self.symbols
-        
-        if exclude_ambiguous:
-            ambiguous = "0O1l|"
-            charset = ''.join(c for c in charset if c not in ambiguous)
-        
-        if not charset:
-            raise ValueError("No character types selected")
-        
-        password = ''.join(random.choice(charset) for _ in range(length))
-        return password
+    def password_options(self):
+        """Current generator options from the checkboxes and length scale"""
+        return {
+            'length': self.length_var.get(),
+            'use_uppercase': self.use_uppercase.get(),
+            'use_digits': self.use_digits.get(),
+            'use_symbols': self.use_symbols.get(),
+            'exclude_ambiguous': self.exclude_ambiguous.get()
+        }
     
-    def check_strength(self, password):
-        score = 0
-        feedback = []
-        
-        if len(password) >= 8:
-            score += 1
-        else:
-            feedback.append("Use at least 8 characters")
-        
-        if any(c.islower() for c in password):
-            score += 1
-        else:
-            feedback.append("Add lowercase letters")
-            
-        if any(c.isupper() for c in password):
-            score += 1
-        else:
-            feedback.append("Add uppercase letters")
-            
-        if any(c.isdigit() for c in password):
-            score += 1
-        else:
-            feedback.append("Add numbers")
-            
-        if any(c in self.symbols for c in password):
-            score += 1
-        else:
-            feedback.append("Add symbols")
-        
-        strength_levels = ["Very Weak", "Weak", "Fair", "Good", "Strong"]
-        strength = strength_levels[min(score, 4)]
-        
-        return strength, feedback
+    def format_password_line(self, index, password):
+        # Strength is only computed for the lines on screen
+        strength, _ = self.generator.check_strength(password)
+        return f"{index + 1:>7}. {password}   [{strength}]"
     
-    def generate_passwords(self):
+    def read_count(self, limit):
         try:
-            # Get user input values
-            length = self.length_var.get()
             count = self.count_var.get()
-            
-            # Validate that at least one character type is selected
-            if not any([True, self.use_uppercase.get(), self.use_digits.get(), self.use_symbols.get()]):
-                messagebox.showerror("Error", "Please select at least one character type!")
-                return
-            
-            # Enable text widget for editing
-            self.passwords_text.config(state="normal")
-            # Clear previous content
-            self.passwords_text.delete(1.0, tk.END)
-            
-            # Store passwords for clipboard functionality
-            self.generated_passwords = []
-            
-            for i in range(count):
-                password = self.generate_password(
-                    length,
-                    self.use_uppercase.get(),
-                    self.use_digits.get(),
-                    self.use_symbols.get(),
-                    self.exclude_ambiguous.get()
-                )
-                
-                strength, feedback = self.check_strength(password)
-                
-                self.generated_passwords.append(password)
-                
-                self.passwords_text.insert(tk.END, f"Password {i+1}:\n")
-                self.passwords_text.insert(tk.END, f"{password}\n")
-                self.passwords_text.insert(tk.END, f"Strength: {strength}\n")
-                
-                if feedback:
-                    self.passwords_text.insert(tk.END, f"Suggestions: {', '.join(feedback)}\n")
-                
-                self.passwords_text.insert(tk.END, "\n" + "-"*50 + "\n\n")
-            
-            # Make text widget read-only again
-            self.passwords_text.config(state="disabled")
-            
+        except tk.TclError:
+            raise ValueError("Please enter a valid number")
+        if not 1 <= count <= limit:
+            raise ValueError(f"Count must be between 1 and {limit:,}")
+        return count
+    
+    def start_worker(self, target, *args):
+        """Run target in a background thread and start polling its results"""
+        self.cancel_event.clear()
+        self.results = queue.Queue()
+        self.exported_count = 0
+        self.generate_btn.config(state="disabled")
+        self.export_btn.config(state="disabled")
+        self.stop_btn.config(state="normal")
+        
+        self.worker = threading.Thread(target=target, args=args, daemon=True)
+        self.worker.start()
+        self.window.after(POLL_INTERVAL, self.poll_results)
+    
+    def generate_passwords(self):
+        try:
+            count = self.read_count(MAX_DISPLAY_COUNT)
+            options = self.password_options()
+            # Fail fast on invalid options before starting the worker
+            self.generator.build_charset(
+                options['use_uppercase'], options['use_digits'],
+                options['use_symbols'], options['exclude_ambiguous']
+            )
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        
+        self.generated_passwords = []
+        self.password_list.set_items(self.generated_passwords)
+        self.status_label.config(text="Generating...")
+        self.start_worker(self.generate_worker, count, options)
+    
+    def generate_worker(self, count, options):
+        """Produce passwords in chunks and hand them to the UI thread"""
+        try:
+            done = 0
+            while done < count and not self.cancel_event.is_set():
+                batch = self.generator.generate_batch(min(CHUNK_SIZE, count - done), **options)
+                done += len(batch)
+                self.results.put(('batch', batch))
+            self.results.put(('done', done))
+        except Exception as e:
+            self.results.put(('error', str(e)))
+    
+    def export_passwords(self):
+        try:
+            count = self.read_count(MAX_FILE_COUNT)
+            options = self.password_options()
+            self.generator.build_charset(
+                options['use_uppercase'], options['use_digits'],
+                options['use_symbols'], options['exclude_ambiguous']
+            )
         except ValueError as e:
             messagebox.showerror("Error", str(e))
+            return
+        
+        filename = filedialog.asksaveasfilename(
+            title="Export passwords",
+            defaultextension=".txt",
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+        
+        self.status_label.config(text="Exporting...")
+        self.start_worker(self.export_worker, filename, count, options)
+    
+    def export_worker(self, filename, count, options):
+        """Generate straight into a file without touching the display"""
+        def make_batch(n):
+            if self.cancel_event.is_set():
+                return []
+            batch = self.generator.generate_batch(n, **options)
+            self.results.put(('progress', len(batch)))
+            return batch
+        
+        try:
+            written = write_passwords(filename, make_batch, count)
+            self.results.put(('exported', (written, filename)))
         except Exception as e:
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            self.results.put(('error', str(e)))
+    
+    def poll_results(self):
+        """Drain worker messages on the UI thread"""
+        finished = False
+        added = False
+        try:
+            while True:
+                kind, payload = self.results.get_nowait()
+                if kind == 'batch':
+                    # Batches still in flight after Stop/Clear are dropped
+                    if not self.cancel_event.is_set():
+                        self.generated_passwords.extend(payload)
+                        added = True
+                elif kind == 'progress':
+                    self.exported_count += payload
+                    self.status_label.config(text=f"Exported {self.exported_count:,}")
+                elif kind == 'done':
+                    finished = True
+                    self.status_label.config(text=f"{payload:,} passwords")
+                elif kind == 'exported':
+                    finished = True
+                    written, filename = payload
+                    self.status_label.config(text=f"Exported {written:,}")
+                    messagebox.showinfo("Exported", f"{written:,} passwords saved to {filename}")
+                elif kind == 'error':
+                    finished = True
+                    self.status_label.config(text="")
+                    messagebox.showerror("Error", f"An error occurred: {payload}")
+        except queue.Empty:
+            pass
+        
+        if added:
+            self.password_list.items_added()
+            if not finished:
+                self.status_label.config(text=f"Generated {len(self.generated_passwords):,}...")
+        
+        if finished:
+            self.generate_btn.config(state="normal")
+            self.export_btn.config(state="normal")
+            self.stop_btn.config(state="disabled")
+        else:
+            self.window.after(POLL_INTERVAL, self.poll_results)
+    
+    def stop_generation(self):
+        self.cancel_event.set()
     
     def clear_display(self):
-        self.passwords_text.config(state="normal")
-        self.passwords_text.delete(1.0, tk.END)
-        self.passwords_text.config(state="disabled")
+        self.cancel_event.set()
         self.generated_passwords = []
+        self.password_list.set_items(self.generated_passwords)
+        self.status_label.config(text="")
     
     def copy_all_passwords(self):
         # Check if passwords exist
@@ -0,0 +1,196 @@
+"""
+Pronounceable passwords from a letter n-gram Markov model.
+The model is trained once from a wordlist and stored as a dense table
+of cumulative counts (one row per context), so loading is a single read
+and sampling a letter is one bisection over a row. The random numbers
+for a whole batch are drawn as one block.
+To train a model manually, run "python password_markov.py words.txt"
+"""
+
+import os
+import sys
+import struct
+import string
+from array import array
+from bisect import bisect_right
+from typing import Iterable, List
+
+from password_wordlist import WordList, is_compiled, read_words
+
+
+MAGIC = b"PWMK"
+VERSION = 1
+# magic, version, order, alphabet size
+HEADER = struct.Struct("<4sIII")
+MODEL_SUFFIX = ".mkv"
+DEFAULT_ORDER = 3
+
+
+class MarkovModel:
+
+    def __init__(self, order: int, letters: str, table: array):
+        # Symbol 0 marks a word boundary, symbols 1.. are the letters
+        self.order = order
+        self.letters = letters
+        self.size = len(letters) + 1
+        self.contexts = self.size ** (order - 1)
+        # Row r holds cumulative counts of each next symbol after context r
+        self.table = table
+
+    @classmethod
+    def train(cls, words: Iterable[str], order: int = DEFAULT_ORDER,
+              letters: str = string.ascii_lowercase) -> 'MarkovModel':
+        """Count n-gram transitions in a list of words"""
+        if order < 2:
+            raise ValueError("Markov order must be at least 2")
+
+        index = {c: i + 1 for i, c in enumerate(letters)}
+        size = len(letters) + 1
+        contexts = size ** (order - 1)
+        counts = [0] * (contexts * size)
+
+        trained = 0
+        for word in words:
+            word = word.lower()
+            if not word or any(c not in index for c in word):
+                continue
+            ctx = 0
+            for symbol in [index[c] for c in word] + [0]:
+                counts[ctx * size + symbol] += 1
+                ctx = (ctx * size + symbol) % contexts
+            trained += 1
+        if not trained:
+            raise ValueError("No usable words to train the model")
+
+        table = array('I')
+        for row in range(contexts):
+            row_counts = counts[row * size:(row + 1) * size]
+            if not any(row_counts):
+                # Unseen context: continue with any letter
+                row_counts = [0] + [1] * (size - 1)
+            total = 0
+            for count in row_counts:
+                total += count
+                table.append(total)
+
+        return cls(order, letters, table)
+
+    def save(self, path: str):
+        """Write the model as header, alphabet and cumulative table"""
+        table = array('I', self.table)
+        if sys.byteorder != 'little':
+            table.byteswap()
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.order, self.size))
+            f.write(self.letters.encode('ascii'))
+            f.write(table.tobytes())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'MarkovModel':
+        """Read a saved model with a single file read"""
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        magic, version, order, size = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a Markov model: {path}")
+
+        start = HEADER.size
+        letters = data[start:start + size - 1].decode('ascii')
+        table = array('I')
+        table.frombytes(data[start + size - 1:])
+        if sys.byteorder != 'little':
+            table.byteswap()
+        if len(table) != size ** order:
+            raise ValueError(f"Corrupt Markov model: {path}")
+
+        return cls(order, letters, table)
+
+    def generate(self, count: int, length: int, capitalize: bool = False,
+                 randbytes=os.urandom) -> List[str]:
+        """Generate count letter strings of the given length"""
+        size = self.size
+        contexts = self.contexts
+        table = self.table
+        symbols = [''] + list(self.letters)
+        # Context 0 means the next letter begins a word
+        first_symbols = [''] + list(self.letters.upper() if capitalize else self.letters)
+
+        # One block of 32-bit random numbers, with room for word boundaries
+        draws = array('I')
+        draws.frombytes(randbytes(4 * (count * length * 5 // 4 + 64)))
+        pos = 0
+
+        result = []
+        for _ in range(count):
+            chars = []
+            ctx = 0
+            while len(chars) < length:
+                if pos == len(draws):
+                    draws = array('I')
+                    draws.frombytes(randbytes(4 * (length * 2 + 64)))
+                    pos = 0
+                base = ctx * size
+                # Scale into [0, row total); the bias is below total / 2**32
+                u = (draws[pos] * table[base + size - 1]) >> 32
+                pos += 1
+                symbol = bisect_right(table, u, base, base + size) - base
+
+                if symbol:
+                    chars.append((first_symbols if ctx == 0 else symbols)[symbol])
+                    ctx = (ctx * size + symbol) % contexts
+                else:
+                    # Word ended: start a new one
+                    ctx = 0
+            result.append(''.join(chars))
+
+        return result
+
+
+def load_model(path: str, order: int = DEFAULT_ORDER) -> MarkovModel:
+    """Open a model, training from a wordlist on first use or when it changed"""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Model or wordlist not found: {path}")
+
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) == MAGIC:
+            return MarkovModel.load(path)
+
+    model_path = os.path.splitext(path)[0] + MODEL_SUFFIX
+    if (os.path.exists(model_path)
+            and os.path.getmtime(model_path) >= os.path.getmtime(path)):
+        model = MarkovModel.load(model_path)
+        if model.order == order:
+            return model
+
+    model = train_from_file(path, order)
+    model.save(model_path)
+    return model
+
+
+def train_from_file(path: str, order: int = DEFAULT_ORDER) -> MarkovModel:
+    """Train from a text wordlist or a compiled wordlist index"""
+    if is_compiled(path):
+        with WordList(path) as wordlist:
+            words = wordlist.words(range(len(wordlist)))
+    else:
+        words = read_words(path)
+    return MarkovModel.train(words, order)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python password_markov.py WORDLIST [MODEL]")
+        sys.exit(1)
+
+    source = sys.argv[1]
+    target = sys.argv[2] if len(sys.argv) == 3 else os.path.splitext(source)[0] + MODEL_SUFFIX
+    try:
+        model = train_from_file(source)
+        model.save(target)
+        print(f"✅ Trained order-{model.order} model to {target}")
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
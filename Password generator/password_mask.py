@@ -0,0 +1,105 @@
+"""
+Mask-based password templates such as "Aaaa-9999-xxxx".
+A mask compiles once into one charset per position; a batch is then
+generated column by column from a single pre-drawn block of random bytes.
+
+Mask tokens:
+  a  lowercase letter        A  uppercase letter
+  9  digit                   #  letter or digit
+  x  lowercase hex digit     X  uppercase hex digit
+  $  symbol                  *  any character
+  [abc]  one of the listed characters
+  \\c  literal c (e.g. \\a, \\[)
+Anything else is copied literally.
+"""
+
+import os
+from collections import Counter
+from functools import lru_cache
+from typing import List, Tuple
+
+from password_engine import bytes_needed, prefetched, random_chars
+
+
+class CompiledMask:
+    """Per-position charsets for one mask"""
+
+    def __init__(self, mask: str, charsets: Tuple[str, ...]):
+        self.mask = mask
+        self.charsets = charsets
+        self.length = len(charsets)
+        # How many random characters each distinct charset supplies per password
+        self.usage = Counter(c for c in charsets if len(c) > 1)
+
+    def generate(self, count: int, randbytes=os.urandom) -> List[str]:
+        """Generate count passwords matching the mask"""
+        if count <= 0:
+            return []
+
+        # One random block covers the whole batch
+        size = sum(bytes_needed(count * uses, charset) for charset, uses in self.usage.items())
+        source = prefetched(size, randbytes) if size else randbytes
+
+        streams = {charset: random_chars(count * uses, charset, source)
+                   for charset, uses in self.usage.items()}
+        taken = Counter()
+
+        columns = []
+        for charset in self.charsets:
+            if len(charset) == 1:
+                columns.append(charset * count)
+                continue
+            start = taken[charset] * count
+            columns.append(streams[charset][start:start + count])
+            taken[charset] += 1
+
+        return [''.join(chars) for chars in zip(*columns)]
+
+
+def parse_mask(mask: str, tokens: Tuple[Tuple[str, str], ...]) -> List[Tuple[str, bool]]:
+    """Split a mask into (charset, is_literal) positions"""
+    token_map = dict(tokens)
+    positions = []
+    i = 0
+    while i < len(mask):
+        c = mask[i]
+        if c == '\\':
+            if i + 1 >= len(mask):
+                raise ValueError("Mask ends with a lone backslash")
+            positions.append((mask[i + 1], True))
+            i += 2
+        elif c == '[':
+            end = mask.find(']', i + 1)
+            if end == -1:
+                raise ValueError("Unclosed '[' in mask")
+            # Keep first occurrence of each character so the set stays uniform
+            charset = ''.join(dict.fromkeys(mask[i + 1:end]))
+            if not charset:
+                raise ValueError("Empty '[]' set in mask")
+            positions.append((charset, False))
+            i = end + 1
+        elif c in token_map:
+            positions.append((token_map[c], False))
+            i += 1
+        else:
+            positions.append((c, True))
+            i += 1
+    return positions
+
+
+@lru_cache(maxsize=64)
+def compile_mask(mask: str, tokens: Tuple[Tuple[str, str], ...],
+                 exclude_ambiguous: bool = False, ambiguous: str = "") -> CompiledMask:
+    """Compile a mask into per-position charsets (cached)"""
+    if not mask:
+        raise ValueError("Mask is empty")
+
+    charsets = []
+    for charset, literal in parse_mask(mask, tokens):
+        if exclude_ambiguous and not literal:
+            charset = ''.join(c for c in charset if c not in ambiguous)
+            if not charset:
+                raise ValueError("A mask position has no characters left after excluding ambiguous ones")
+        charsets.append(charset)
+
+    return CompiledMask(mask, tuple(charsets))
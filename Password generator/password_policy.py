@@ -0,0 +1,229 @@
+"""
+Password policies compiled into exact counting tables.
+A compiled policy knows how many compliant passwords exist from every
+position and state, so a password is built by unranking one uniform
+random number in a single pass - no regenerate-until-valid loops, and
+every compliant password is equally likely.
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import repeat
+from operator import add, mul, sub
+from typing import Dict, List, Tuple
+
+from password_engine import random_indices
+
+
+# Class keys used by minimums and template positions
+CLASS_KEYS = "luds"
+# Largest counting table compiled, in entries (positions x combinations of
+# unmet class minimums, x classes with a repeat limit). Tables grow with the
+# product of the minimums; this keeps one under about 100 MB and a second
+MAX_STATES = 1_000_000
+
+
+@dataclass(frozen=True)
+class PasswordPolicy:
+    """Requirements a generated password must satisfy"""
+    min_lower: int = 0
+    min_upper: int = 0
+    min_digits: int = 0
+    min_symbols: int = 0
+    # Characters that may never appear
+    forbidden: str = ""
+    # Longest allowed run of one repeated character (0 = unlimited)
+    max_repeats: int = 0
+    # (index, class keys) pairs, e.g. ((0, "lu"), (-1, "d")) for
+    # "starts with a letter, ends with a digit"
+    positions: Tuple[Tuple[int, str], ...] = ()
+
+    def minimums(self) -> Dict[str, int]:
+        return {'l': self.min_lower, 'u': self.min_upper,
+                'd': self.min_digits, 's': self.min_symbols}
+
+    def allows(self, password: str, classes: Tuple[Tuple[str, str], ...]) -> bool:
+        """Check a password against the policy for the given class charsets"""
+        lookup = {c: key for key, charset in classes for c in charset}
+        keys = [lookup.get(c) for c in password]
+        if None in keys or any(c in self.forbidden for c in password):
+            return False
+
+        for key, minimum in self.minimums().items():
+            if keys.count(key) < minimum:
+                return False
+
+        for index, allowed in self.positions:
+            if not -len(password) <= index < len(password):
+                return False
+            if keys[index] not in allowed:
+                return False
+
+        if self.max_repeats:
+            run = 0
+            for i, c in enumerate(password):
+                run = run + 1 if i and password[i - 1] == c else 1
+                if run > self.max_repeats:
+                    return False
+
+        return True
+
+
+class CompiledPolicy:
+    """Counting tables for one policy, password length and charset"""
+
+    def __init__(self, policy: PasswordPolicy, length: int,
+                 classes: Tuple[Tuple[str, str], ...]):
+        self.policy = policy
+        self.length = length
+
+        # Drop forbidden characters, then empty classes
+        self.keys = []
+        self.charsets = []
+        for key, charset in classes:
+            charset = ''.join(c for c in charset if c not in policy.forbidden)
+            if charset:
+                self.keys.append(key)
+                self.charsets.append(charset)
+        self.sizes = [len(c) for c in self.charsets]
+
+        minimums = policy.minimums()
+        if min(minimums.values()) < 0 or policy.max_repeats < 0:
+            raise ValueError("Policy limits cannot be negative")
+        for key, minimum in minimums.items():
+            if minimum and key not in self.keys:
+                raise ValueError(f"Policy requires class '{key}' which has no usable characters")
+        self.minimums = tuple(minimums[key] for key in self.keys)
+
+        # Classes allowed at every position
+        every = tuple(range(len(self.keys)))
+        self.allowed = [every] * length
+        for index, class_keys in policy.positions:
+            if not -length <= index < length:
+                raise ValueError(f"Template position {index} is outside a {length}-character password")
+            unknown = set(class_keys) - set(CLASS_KEYS)
+            if unknown:
+                raise ValueError(f"Unknown class keys in template: {''.join(sorted(unknown))}")
+            self.allowed[index] = tuple(i for i, key in enumerate(self.keys) if key in class_keys)
+
+        self.max_repeats = policy.max_repeats
+        # A step is one run of a repeated character: up to max_repeats long,
+        # and a different character from the run before. Without a limit a
+        # step is one character of any kind
+        self.run_limit = self.max_repeats or 1
+        # Positions from each one on where class k may appear in a row
+        self.spans = []
+        for k in range(len(self.keys)):
+            span = [0] * (length + 1)
+            for pos in range(length - 1, -1, -1):
+                span[pos] = span[pos + 1] + 1 if k in self.allowed[pos] else 0
+            self.spans.append(span)
+
+        # Minimums still to meet, packed into one index with a digit per class
+        self.strides = []
+        size = 1
+        for minimum in self.minimums:
+            self.strides.append(size)
+            size *= minimum + 1
+        tables = len(self.keys) if self.max_repeats else 1
+        if sum(self.minimums) > length:
+            raise ValueError("No password of this length satisfies the policy")
+        if length * size * tables > MAX_STATES:
+            raise ValueError("Policy is too complex to compile: lower the class minimums "
+                             "or the password length")
+        self.digits = [[index // stride % (minimum + 1) for index in range(size)]
+                       for stride, minimum in zip(self.strides, self.minimums)]
+        self._build(size, tables)
+        self._options = {}
+
+        self.start = sum(m * stride for m, stride in zip(self.minimums, self.strides))
+        self.total = sum(weight for weight, _, _, _ in self._transitions(0, self.start, -1))
+        if self.total == 0:
+            raise ValueError("No password of this length satisfies the policy")
+
+    def _build(self, size: int, tables: int):
+        """Fill counts[pos][k][need]: compliant completions from pos with the
+        need index still to meet, after a run of class k (k is always 0
+        without a repeat limit, where the previous run does not matter).
+        Completions after class k are all completions, less those whose
+        next run reuses k's last character, so every entry of a position
+        comes from one pass over the runs that can start there. Rows are
+        combined a whole position at a time to keep the loops in C"""
+        # Need index after a run of each length, for every need index
+        shifts = [[[index - min(run, digit) * stride for index, digit in enumerate(digits)]
+                   for run in range(1, self.run_limit + 1)]
+                  for digits, stride in zip(self.digits, self.strides)]
+        done = [1] + [0] * (size - 1)
+        self.counts = [None] * self.length + [[done] * tables]
+
+        for pos in range(self.length - 1, -1, -1):
+            total = [0] * size
+            same = {}
+            for k in self.allowed[pos]:
+                table = k if tables > 1 else 0
+                runs = [0] * size
+                for run in range(1, min(self.run_limit, self.spans[k][pos]) + 1):
+                    row = self.counts[pos + run][table]
+                    runs = list(map(add, runs, map(row.__getitem__, shifts[k][run - 1])))
+                same[k] = runs
+                total = list(map(add, total, map(mul, runs, repeat(self.sizes[k]))))
+            if tables == 1:
+                self.counts[pos] = [total]
+            else:
+                self.counts[pos] = [list(map(sub, total, same[k])) if k in same else total
+                                    for k in range(tables)]
+
+    def _transitions(self, pos: int, need: int, last: int) -> List[Tuple[int, int, int, int]]:
+        """(weight, class, run length, next need) for each run starting at
+        pos, after a run of class last (-1 at the start)"""
+        state = (pos, need, last)
+        cached = self._options.get(state)
+        if cached is not None:
+            return cached
+
+        options = []
+        for k in self.allowed[pos]:
+            table = k if self.max_repeats else 0
+            fresh = self.sizes[k] - (self.max_repeats and k == last)
+            for run in range(1, min(self.run_limit, self.spans[k][pos]) + 1):
+                nxt = need - min(run, self.digits[k][need]) * self.strides[k]
+                weight = fresh * self.counts[pos + run][table][nxt]
+                if weight:
+                    options.append((weight, k, run, nxt))
+        self._options[state] = options
+        return options
+
+    def unrank(self, rank: int) -> str:
+        """Build the compliant password with the given rank in [0, total)"""
+        chars = []
+        pos, need, last = 0, self.start, -1
+        last_char = ""
+        while pos < self.length:
+            for weight, k, run, nxt in self._transitions(pos, need, last):
+                if rank < weight:
+                    break
+                rank -= weight
+
+            charset = self.charsets[k]
+            if self.max_repeats and k == last:
+                # Skip the previous character within its own class
+                charset = charset.replace(last_char, "", 1)
+            # Each character of the run heads the same number of completions
+            choice, rank = divmod(rank, weight // len(charset))
+            last_char = charset[choice]
+            chars.append(last_char * run)
+            pos, need, last = pos + run, nxt, k
+
+        return ''.join(chars)
+
+    def sample(self, count: int, randbytes=os.urandom) -> List[str]:
+        """Draw count uniformly distributed compliant passwords"""
+        return [self.unrank(rank) for rank in random_indices(count, self.total, randbytes)]
+
+
+@lru_cache(maxsize=4)
+def compile_policy(policy: PasswordPolicy, length: int,
+                   classes: Tuple[Tuple[str, str], ...]) -> CompiledPolicy:
+    """Compile a policy, reusing tables across calls with the same inputs"""
+    return CompiledPolicy(policy, length, classes)
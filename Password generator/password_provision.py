@@ -0,0 +1,89 @@
+"""
+Bulk account provisioning: generate a password for every username and
+hash it with bcrypt across a process pool, emitting
+(username, password, bcrypt_hash) rows in input order.
+"""
+
+import os
+import csv
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import bcrypt
+
+
+DEFAULT_COST = 12
+MIN_COST, MAX_COST = 4, 31
+# bcrypt ignores (or, in newer releases, rejects) anything past 72 bytes
+BCRYPT_MAX_BYTES = 72
+
+
+def hash_password(password: str, cost: int = DEFAULT_COST) -> str:
+    """Hash password using bcrypt"""
+    salt = bcrypt.gensalt(rounds=cost)
+    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+
+
+def read_usernames(path: str) -> List[str]:
+    """Read one username per line, skipping blanks"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def provision(usernames: List[str], make_batch: Callable[[int], List[str]],
+              cost: int = DEFAULT_COST,
+              workers: Optional[int] = None) -> Iterator[Tuple[str, str, str]]:
+    """(username, password, bcrypt_hash) rows in the order of usernames.
+    The cost and the passwords are checked here, before any row is produced,
+    so an invalid run fails before its output is touched"""
+    if not MIN_COST <= cost <= MAX_COST:
+        raise ValueError(f"bcrypt cost must be between {MIN_COST} and {MAX_COST}")
+
+    passwords = make_batch(len(usernames))
+    for password in passwords:
+        if len(password.encode('utf-8')) > BCRYPT_MAX_BYTES:
+            raise ValueError(f"Passwords longer than {BCRYPT_MAX_BYTES} bytes cannot be hashed with bcrypt")
+
+    return hash_rows(usernames, passwords, cost, workers)
+
+
+def hash_rows(usernames: List[str], passwords: List[str], cost: int,
+              workers: Optional[int] = None) -> Iterator[Tuple[str, str, str]]:
+    workers = workers or os.cpu_count() or 1
+    # Large chunks keep inter-process overhead low; several per worker keep cores busy
+    chunksize = max(1, len(passwords) // (workers * 8))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        hashes = pool.map(hash_password, passwords, repeat(cost), chunksize=chunksize)
+        yield from zip(usernames, passwords, hashes)
+
+
+def write_rows(rows: Iterator[Tuple[str, str, str]], filename: Optional[str] = None) -> int:
+    """Write rows as CSV to a file (or stdout) and return how many were written.
+    A file is written under a temp name and renamed when complete, so a
+    failed run leaves any previous output in place"""
+    if not filename:
+        return write_csv(rows, sys.stdout)
+
+    tmp_path = filename + ".tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            written = write_csv(rows, f)
+        os.replace(tmp_path, filename)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return written
+
+
+def write_csv(rows: Iterator[Tuple[str, str, str]], f) -> int:
+    writer = csv.writer(f)
+    writer.writerow(['username', 'password', 'bcrypt_hash'])
+    written = 0
+    for row in rows:
+        writer.writerow(row)
+        written += 1
+    return written
@@ -0,0 +1,144 @@
+"""
+Compact uniqueness tracking for bulk code generation.
+Issued values are stored as 64-bit fingerprints in an open-addressing
+table backed by array('Q'), about 8-11 bytes per entry instead of ~80
+for a set of strings, and the table can be saved and reloaded between runs.
+"""
+
+import os
+import struct
+from array import array
+from hashlib import blake2b
+from typing import Callable, List
+
+
+MAGIC = b"PWFP"
+VERSION = 1
+# magic, version, entry count, table size
+HEADER = struct.Struct("<4sIQQ")
+MAX_LOAD = 0.75
+# Smallest number of candidates drawn per round, and how many
+# all-duplicate rounds in a row mean the code space is exhausted
+MIN_DRAW = 1024
+MAX_MISSES = 100
+
+
+def fingerprint(value: str) -> int:
+    """64-bit fingerprint of a value (never 0, which marks empty slots)"""
+    fp = int.from_bytes(blake2b(value.encode('utf-8'), digest_size=8).digest(), 'little')
+    return fp or 1
+
+
+class FingerprintSet:
+
+    def __init__(self, capacity: int = 1024):
+        size = 16
+        while size * MAX_LOAD < capacity:
+            size *= 2
+        self._table = array('Q', [0]) * size
+        self._mask = size - 1
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, value: str) -> bool:
+        fp = fingerprint(value)
+        table = self._table
+        mask = self._mask
+        i = fp & mask
+        while True:
+            slot = table[i]
+            if slot == fp:
+                return True
+            if slot == 0:
+                return False
+            i = (i + 1) & mask
+
+    def add(self, value: str) -> bool:
+        """Record a value; return False if it was already present"""
+        return self.add_fingerprint(fingerprint(value))
+
+    def add_fingerprint(self, fp: int) -> bool:
+        if (self._count + 1) > len(self._table) * MAX_LOAD:
+            self._grow()
+
+        table = self._table
+        mask = self._mask
+        i = fp & mask
+        while True:
+            slot = table[i]
+            if slot == fp:
+                return False
+            if slot == 0:
+                table[i] = fp
+                self._count += 1
+                return True
+            i = (i + 1) & mask
+
+    def _grow(self):
+        """Double the table and reinsert every fingerprint"""
+        old = self._table
+        size = len(old) * 2
+        self._table = array('Q', [0]) * size
+        self._mask = size - 1
+        self._count = 0
+        for fp in old:
+            if fp:
+                self.add_fingerprint(fp)
+
+    def save(self, path: str):
+        """Write the table to disk"""
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self._count, len(self._table)))
+            self._table.tofile(f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'FingerprintSet':
+        """Read a table saved with save()"""
+        with open(path, 'rb') as f:
+            magic, version, count, size = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"Not a fingerprint store: {path}")
+            fps = cls.__new__(cls)
+            fps._table = array('Q')
+            fps._table.fromfile(f, size)
+        fps._mask = size - 1
+        fps._count = count
+        return fps
+
+    @classmethod
+    def open(cls, path: str, capacity: int = 1024) -> 'FingerprintSet':
+        """Load a saved table, or start an empty one if the file is missing"""
+        if os.path.exists(path):
+            return cls.load(path)
+        return cls(capacity)
+
+
+def unique_batches(make_batch: Callable[[int], List[str]],
+                   seen: FingerprintSet) -> Callable[[int], List[str]]:
+    """Wrap a batch function so it only returns values not issued before"""
+    def make_unique_batch(n: int) -> List[str]:
+        result = []
+        misses = 0
+        while len(result) < n:
+            # Draw extra candidates so nearly-full code spaces still make progress;
+            # only values actually returned are recorded as issued
+            found = 0
+            for p in make_batch(max(n - len(result), MIN_DRAW)):
+                if seen.add(p):
+                    result.append(p)
+                    found += 1
+                    if len(result) == n:
+                        break
+            if found:
+                misses = 0
+            else:
+                misses += 1
+                if misses >= MAX_MISSES:
+                    raise ValueError("Could not find new unique values; the code space is exhausted")
+        return result
+
+    return make_unique_batch
@@ -0,0 +1,159 @@
+"""
+Indexed wordlists for passphrase generation.
+A text wordlist is compiled once into a binary file holding an offset
+table followed by the concatenated words, so picking a word is a single
+slice of a memory-mapped file instead of reading and splitting text.
+To compile a wordlist manually, run "python password_wordlist.py words.txt"
+"""
+
+import os
+import sys
+import mmap
+import struct
+from array import array
+from typing import Iterable, List, Optional
+
+
+MAGIC = b"PWWL"
+VERSION = 1
+# magic, version, word count
+HEADER = struct.Struct("<4sII")
+INDEX_SUFFIX = ".idx"
+
+
+class WordList:
+
+    def __init__(self, path: str):
+        # Map the compiled file and expose offsets without copying
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Not a compiled wordlist: {path}")
+
+        offsets_start = HEADER.size
+        data_start = offsets_start + 4 * (count + 1)
+        offsets_view = memoryview(self._map)[offsets_start:data_start]
+        if sys.byteorder == 'little':
+            self._offsets = offsets_view.cast('I')
+        else:
+            self._offsets = array('I', offsets_view)
+            self._offsets.byteswap()
+        self._data = memoryview(self._map)[data_start:]
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> str:
+        if not -self._count <= index < self._count:
+            raise IndexError("word index out of range")
+        index %= self._count
+        offsets = self._offsets
+        return str(self._data[offsets[index]:offsets[index + 1]], 'utf-8')
+
+    def words(self, indices: Iterable[int]) -> List[str]:
+        """Look up many words at once"""
+        offsets = self._offsets
+        data = self._data
+        return [str(data[offsets[i]:offsets[i + 1]], 'utf-8') for i in indices]
+
+    def close(self):
+        """Release the memory map and file handle"""
+        for attr in ('_offsets', '_data'):
+            view = getattr(self, attr, None)
+            if isinstance(view, memoryview):
+                view.release()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_words(source: str) -> List[str]:
+    """Read words from a text file (plain or diceware "11111 word" format)"""
+    words = []
+    seen = set()
+    with open(source, 'r', encoding='utf-8') as f:
+        for line in f:
+            parts = line.split()
+            if not parts or parts[0].startswith('#'):
+                continue
+            # Diceware lists put the dice roll first, the word last
+            word = parts[-1]
+            if word not in seen:
+                seen.add(word)
+                words.append(word)
+    return words
+
+
+def compile_wordlist(source: str, target: Optional[str] = None) -> str:
+    """Compile a text wordlist into an indexed binary file"""
+    if target is None:
+        target = os.path.splitext(source)[0] + INDEX_SUFFIX
+
+    words = read_words(source)
+    if not words:
+        raise ValueError(f"Wordlist is empty: {source}")
+
+    encoded = [w.encode('utf-8') for w in words]
+    offsets = array('I', [0])
+    total = 0
+    for word in encoded:
+        total += len(word)
+        offsets.append(total)
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+
+    # Write to a temp file first so readers never see a partial index
+    tmp_path = target + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(words)))
+        f.write(offsets.tobytes())
+        f.write(b''.join(encoded))
+    os.replace(tmp_path, target)
+
+    return target
+
+
+def is_compiled(path: str) -> bool:
+    """Check whether a file is a compiled wordlist"""
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def load_wordlist(path: str) -> WordList:
+    """Open a wordlist, compiling text sources on first use or when changed"""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Wordlist not found: {path}")
+
+    if is_compiled(path):
+        return WordList(path)
+
+    index_path = os.path.splitext(path)[0] + INDEX_SUFFIX
+    if (not os.path.exists(index_path)
+            or os.path.getmtime(index_path) < os.path.getmtime(path)):
+        compile_wordlist(path, index_path)
+
+    return WordList(index_path)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python password_wordlist.py SOURCE [TARGET]")
+        sys.exit(1)
+
+    try:
+        output = compile_wordlist(*sys.argv[1:])
+        with WordList(output) as wordlist:
+            print(f"✅ Compiled {len(wordlist)} words to {output}")
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)